@@ -0,0 +1,174 @@
+"""Shared settings and helpers for the Jira/Confluence probe scripts.
+
+.env is parsed once here, however many probe modules import it.
+"""
+
+import asyncio
+import aiohttp
+import hashlib
+import orjson
+import os
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+JIRA_BASE_URL = "https://athonprompt.atlassian.net/rest/api/3"
+CONFLUENCE_BASE_URL = "https://athonprompt.atlassian.net/wiki/rest/api"
+
+JIRA_TOKEN = os.getenv("IRA_MCP_AUTH_TOKEN")  # Note: it's IRA, not JIRA
+CONFLUENCE_TOKEN = os.getenv("CONFLUENCE_MCP_AUTH_TOKEN")
+
+# Turns a decoded 200 response into report lines
+Handler = Callable[[Any], List[str]]
+
+# Endpoints whose answers don't change between runs; their 200 responses are
+# kept on disk for PROBE_CACHE_TTL seconds (0 disables) and reused
+MEMOIZED_PATHS = ("/myself", "/serverInfo")
+MEMO_TTL_SECONDS = int(os.getenv("PROBE_CACHE_TTL", "3600"))
+MEMO_PATH = Path.home() / ".cache" / "jira_probe" / "responses.json"
+_memo: Optional[Dict[str, Dict[str, Any]]] = None
+_memo_dirty = False
+
+def _memo_entries() -> Dict[str, Dict[str, Any]]:
+    """The on-disk memo, read on first use."""
+    global _memo
+    if _memo is None:
+        try:
+            _memo = orjson.loads(MEMO_PATH.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            _memo = {}
+    return _memo
+
+def _memo_key(url: str, token: str) -> Optional[str]:
+    """Memo key for url, or None if it is not memoized.
+
+    Keyed by a truncated token hash, so the token never lands on disk.
+    """
+    if MEMO_TTL_SECONDS <= 0 or not url.endswith(MEMOIZED_PATHS):
+        return None
+    return f"{url}#{hashlib.sha256(token.encode()).hexdigest()[:16]}"
+
+def _save_memo() -> None:
+    global _memo_dirty
+    if not _memo_dirty:
+        return
+    try:
+        MEMO_PATH.parent.mkdir(parents=True, exist_ok=True)
+        MEMO_PATH.write_bytes(orjson.dumps(_memo))
+        MEMO_PATH.chmod(0o600)  # Holds account details
+    except OSError as e:
+        print(f"⚠️ Could not save probe cache: {e}")
+    _memo_dirty = False
+
+def list_report(noun: str, extract: Callable[[Any], Any], limit: int) -> Handler:
+    """Handler listing "key: name" for the items extract() pulls out of a response.
+
+    The response shape is known per endpoint, so extract() just indexes into it;
+    anything unexpected is reported raw instead.
+    """
+    def report(data: Any) -> List[str]:
+        try:
+            items = extract(data)
+        except (KeyError, TypeError):
+            items = None
+        if not isinstance(items, list):
+            return [f"   📋 Response: {type(data)} - {str(data)[:200]}"]
+        return [f"   📋 Found {len(items)} {noun}:"] + [
+            f"      - {item.get('key', 'N/A')}: {item.get('name', 'N/A')}" for item in items[:limit]
+        ]
+    return report
+
+@asynccontextmanager
+async def probe_session(session: Optional[aiohttp.ClientSession] = None) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield session if given (e.g. shared by run_all.py), else a new one for this run.
+
+    Jira and Confluence live on the same host, so one session keeps its TCP/TLS
+    connections alive across every probe; auth goes per request. The pool has
+    room for every fanned-out GET to be in flight at once, and ssl=False skips
+    certificate verification without building an SSL context.
+    """
+    if session is not None:
+        yield session
+        return
+    connector = aiohttp.TCPConnector(
+        ssl=False, limit=32, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=75
+    )
+    async with aiohttp.ClientSession(connector=connector) as own_session:
+        yield own_session
+
+async def fetch(session: aiohttp.ClientSession, url: str, headers: Dict[str, str], decode: bool = True) -> Tuple[int, Any]:
+    """GET url and return (status, JSON body), with no body unless the status is 200.
+
+    With decode=False the body is still read, so the connection goes back to
+    the keep-alive pool, but it is not parsed.
+    """
+    async with session.get(url, headers=headers) as resp:
+        status = resp.status
+        body = await resp.read() if status == 200 else b""
+    # Parsed after the block, once the connection is back in the pool
+    return status, (orjson.loads(body) if body and decode else None)
+
+async def fetch_report(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Dict[str, str],
+    handler: Optional[Handler],
+    memo_key: Optional[str] = None,
+) -> Tuple[int, List[str], bool]:
+    """fetch() url and return (status, handler's lines for a 200 response, cached?).
+
+    With memo_key, a fresh memoized response is used instead of the network.
+    """
+    global _memo_dirty
+    entry = _memo_entries().get(memo_key) if memo_key else None
+    if entry is not None and time.time() - entry["ts"] < MEMO_TTL_SECONDS:
+        status, data, cached = 200, entry["data"], True
+    else:
+        # Memoized responses are always decoded: another script may report them
+        status, data = await fetch(session, url, headers, handler is not None or memo_key is not None)
+        cached = False
+        if status == 200 and memo_key:
+            _memo_entries()[memo_key] = {"ts": time.time(), "data": data}
+            _memo_dirty = True
+    return status, (handler(data) if status == 200 and handler is not None else []), cached
+
+async def probe(
+    session: aiohttp.ClientSession,
+    token: str,
+    probes: Sequence[Tuple[str, str]],
+    handlers: Mapping[str, Handler],
+    indent: str = "",
+) -> List[List[str]]:
+    """GET every (label, url) in probes at once and report each result.
+
+    Returns one list of lines per probe, in probe order. Only responses with
+    a handler are decoded; the handler's lines follow the success line.
+    Network and handler errors alike come back from gather() as values.
+    """
+    headers = {"Authorization": token}
+    results = await asyncio.gather(
+        *(
+            fetch_report(session, url, headers, handlers.get(label), _memo_key(url, token))
+            for label, url in probes
+        ),
+        return_exceptions=True,
+    )
+    _save_memo()
+    reports: List[List[str]] = []
+    for (label, _), result in zip(probes, results):
+        if isinstance(result, Exception):
+            reports.append([f"{indent}❌ {label}: Error - {str(result)}"])
+            continue
+        if isinstance(result, BaseException):  # e.g. a cancelled task
+            raise result
+        status, lines, cached = result
+        if status == 200:
+            reports.append([f"{indent}✅ {label}: {status}{' (cached)' if cached else ''}", *lines])
+        else:
+            reports.append([f"{indent}❌ {label}: {status}"])
+    return reports
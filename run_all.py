@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Run every Jira/Confluence probe script in one event loop and session."""
+
+import asyncio
+
+import test_jira_confluence
+import test_jira_projects
+from probe_common import probe_session
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; the default loop works too
+    uvloop = None
+
+async def main():
+    """Run the probe scripts back to back over one warm connection pool."""
+    async with probe_session() as session:
+        # Sequential so each script's report stays contiguous; the second one
+        # reuses the connections the first opened
+        await test_jira_confluence.main(session)
+        print()
+        await test_jira_projects.main(session)
+
+if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())
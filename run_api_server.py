@@ -14,6 +14,8 @@ load_dotenv()
 
 import uvicorn
 
+from src.api.server import uvicorn_options
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -44,16 +46,10 @@ def main():
     logger.info(f"🎫 Jira URL: {os.getenv('JIRA_MCP_URL')}")
     logger.info(f"📄 Confluence URL: {os.getenv('CONFLUENCE_MCP_URL')}")
     
-    # Run the server
-    uvicorn.run(
-        "src.api.server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info",
-        access_log=True,
-    )
-
+    options = uvicorn_options()
+    logger.info(f"⚙️ Workers: {options['workers']} (reload={'on' if options['reload'] else 'off'})")
+    
+    uvicorn.run("src.api.server:app", **options, access_log=True)
 
 if __name__ == "__main__":
     main()
@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.agent_base import BaseAgent
 from ..core.types import Command
@@ -144,6 +144,47 @@ class JiraAgent(BaseAgent):
         self._set_cache(cache_key, issues)
         return issues
 
+    async def get_issue_columns(
+        self,
+        project: str,
+        fields: Tuple[str, ...],
+        jql_filter: Optional[str] = None,
+        max_results: int = 100,
+    ) -> Dict[str, List[Any]]:
+        """Fetch only the given fields of a project's issues, one list per field.
+
+        Cheaper than get_issues() for aggregates: Jira returns just these
+        fields and no JiraIssue objects are built. Object values such as
+        status or assignee are reduced to their name, e.g.
+        {"key": ["PRJ-1"], "status": ["Done"], "labels": [["sp-3"]]}.
+        """
+        project_key = await self.find_project_by_name(project)
+        if not project_key:
+            logger.error(f"❌ Project '{project}' not found in Jira")
+            return {"key": [], **{name: [] for name in fields}}
+
+        cache_key = f"issue_columns:{project_key}:{','.join(fields)}:{jql_filter}:{max_results}"
+        cached = self._get_cache(cache_key)
+        if cached is not None:
+            return cached
+
+        jql = f"project = {project_key}"
+        if jql_filter:
+            jql = f"{jql} AND {jql_filter}"
+        response = await self.mcp_client.request(
+            "/search", method="GET", params={
+                "jql": jql,
+                "maxResults": max_results,
+                "fields": ",".join(fields),
+            }
+        )
+        issues = response.get("issues", [])
+        columns: Dict[str, List[Any]] = {"key": [data["key"] for data in issues]}
+        for name in fields:
+            columns[name] = [_field_value(data.get("fields", {}).get(name)) for data in issues]
+        self._set_cache(cache_key, columns)
+        return columns
+
     async def create_issue(
         self,
         project: str,
@@ -293,3 +334,14 @@ class JiraAgent(BaseAgent):
 
     async def shutdown(self) -> None:
         await self.mcp_client.disconnect()
+
+
+def _field_value(value: Any) -> Any:
+    """Reduce a Jira field object (status, assignee, ...) to its display value.
+
+    User objects also carry a username in "name" on Jira Server/DC, so
+    displayName wins, matching how get_issues reports assignees.
+    """
+    if isinstance(value, dict):
+        return value.get("displayName") or value.get("name") or value.get("key")
+    return value
@@ -1,6 +1,7 @@
 """Scrum Master agent that orchestrates project management using Jira and Confluence agents."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
@@ -12,6 +13,18 @@ from .confluence_agent import ConfluenceAgent
 
 logger = logging.getLogger(__name__)
 
+# Jira status name (upper-cased) -> standup status_summary bucket
+_STATUS_BUCKETS: Dict[str, str] = {
+    **dict.fromkeys(("TO DO", "OPEN", "NEW"), "TODO"),
+    **dict.fromkeys(("IN PROGRESS", "WORK IN PROGRESS"), "IN_PROGRESS"),
+    **dict.fromkeys(("DONE", "CLOSED", "RESOLVED"), "DONE"),
+    **dict.fromkeys(("BLOCKED", "IMPEDIMENT"), "BLOCKED"),
+}
+_TEAM_UPDATE_BUCKETS = {"TODO": "todo", "IN_PROGRESS": "in_progress", "DONE": "done"}
+# Issue fields fetched for standups and burndowns (see JiraAgent.get_issue_columns)
+_STANDUP_FIELDS = ("summary", "status", "assignee")
+_BURNDOWN_FIELDS = ("status", "labels")
+
 
 class ScrumMasterAgent(BaseAgent):
     """
@@ -45,8 +58,10 @@ class ScrumMasterAgent(BaseAgent):
         """Initialize the Scrum Master and underlying agents."""
         logger.info("🏃‍♂️ Initializing Scrum Master Agent...")
         
-        jira_ok = await self.jira_agent.initialize()
-        confluence_ok = await self.confluence_agent.initialize()
+        jira_ok, confluence_ok = await asyncio.gather(
+            self.jira_agent.initialize(),
+            self.confluence_agent.initialize(),
+        )
         
         if jira_ok:
             logger.info("✅ Jira Agent connected")
@@ -239,50 +254,36 @@ class ScrumMasterAgent(BaseAgent):
         if not self.current_sprint:
             return {"error": "No active sprint found"}
         
-        # Get current sprint issues
-        sprint_issues = await self.jira_agent.get_issues(
-            project=jira_project_key,
-            assignee=None,  # Get all issues
-            max_results=50
+        # Sprint-planned issues only, filtered by Jira, with just the fields used below
+        columns = await self.jira_agent.get_issue_columns(
+            jira_project_key,
+            _STANDUP_FIELDS,
+            jql_filter='labels = "sprint-planned"',
+            max_results=50,
         )
         
-        # Filter issues in current sprint (by labels or creation date)
-        current_issues = [
-            issue for issue in sprint_issues 
-            if any(label in ["sprint-planned"] for label in issue.labels)
-        ]
-        
         # Analyze progress
         status_summary = {"TODO": 0, "IN_PROGRESS": 0, "DONE": 0, "BLOCKED": 0}
         team_updates = {}
         blocked_issues = []
         
-        for issue in current_issues:
-            # Count by status
-            if issue.status.upper() in ["TO DO", "OPEN", "NEW"]:
-                status_summary["TODO"] += 1
-            elif issue.status.upper() in ["IN PROGRESS", "WORK IN PROGRESS"]:
-                status_summary["IN_PROGRESS"] += 1
-            elif issue.status.upper() in ["DONE", "CLOSED", "RESOLVED"]:
-                status_summary["DONE"] += 1
-            elif issue.status.upper() in ["BLOCKED", "IMPEDIMENT"]:
-                status_summary["BLOCKED"] += 1
-                blocked_issues.append({"key": issue.key, "summary": issue.summary})
+        for key, summary, status, assignee in zip(
+            columns["key"], columns["summary"], columns["status"], columns["assignee"]
+        ):
+            entry = {"key": key, "summary": summary or ""}
+            bucket = _STATUS_BUCKETS.get((status or "").upper())
+            if bucket is not None:
+                status_summary[bucket] += 1
+            if bucket == "BLOCKED":
+                blocked_issues.append(entry)
             
             # Group by assignee
-            assignee = issue.assignee or "Unassigned"
-            if assignee not in team_updates:
-                team_updates[assignee] = {"todo": [], "in_progress": [], "done": []}
-            
-            if issue.status.upper() in ["TO DO", "OPEN", "NEW"]:
-                team_updates[assignee]["todo"].append({"key": issue.key, "summary": issue.summary})
-            elif issue.status.upper() in ["IN PROGRESS", "WORK IN PROGRESS"]:
-                team_updates[assignee]["in_progress"].append({"key": issue.key, "summary": issue.summary})
-            elif issue.status.upper() in ["DONE", "CLOSED", "RESOLVED"]:
-                team_updates[assignee]["done"].append({"key": issue.key, "summary": issue.summary})
+            updates = team_updates.setdefault(assignee or "Unassigned", {"todo": [], "in_progress": [], "done": []})
+            if bucket in _TEAM_UPDATE_BUCKETS:
+                updates[_TEAM_UPDATE_BUCKETS[bucket]].append(entry)
         
         # Calculate sprint progress
-        total_issues = len(current_issues)
+        total_issues = len(columns["key"])
         completed_issues = status_summary["DONE"]
         progress_percentage = (completed_issues / total_issues * 100) if total_issues > 0 else 0
         
@@ -498,16 +499,15 @@ class ScrumMasterAgent(BaseAgent):
             return {"error": "No active sprint"}
         
         # Get sprint issues and calculate remaining work
-        issues = await self.jira_agent.get_issues(project=jira_project_key, max_results=100)
+        columns = await self.jira_agent.get_issue_columns(jira_project_key, _BURNDOWN_FIELDS, max_results=100)
         
         total_story_points = self.current_sprint.get("committed_story_points", 0)
-        completed_points = 0
-        
-        for issue in issues:
-            if issue.status.upper() in ["DONE", "CLOSED", "RESOLVED"]:
-                # Extract story points from labels or estimate
-                story_points = self._extract_story_points(issue.labels)
-                completed_points += story_points
+        completed_points = sum(
+            # Extract story points from labels or estimate
+            self._extract_story_points(labels or [])
+            for status, labels in zip(columns["status"], columns["labels"])
+            if _STATUS_BUCKETS.get((status or "").upper()) == "DONE"
+        )
         
         remaining_points = total_story_points - completed_points
         
@@ -539,6 +539,12 @@ class ScrumMasterAgent(BaseAgent):
     async def shutdown(self) -> None:
         """Shutdown the Scrum Master Agent."""
         logger.info("🏃‍♂️ Shutting down Scrum Master Agent...")
-        await self.jira_agent.shutdown()
-        await self.confluence_agent.shutdown()
+        results = await asyncio.gather(
+            self.jira_agent.shutdown(),
+            self.confluence_agent.shutdown(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Agent shutdown failed: {result}")
         logger.info("✅ Scrum Master Agent shutdown complete")
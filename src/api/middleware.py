@@ -0,0 +1,116 @@
+"""Pure ASGI middleware for the AI Scrum Master REST API."""
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Sequence
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+_ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+# Request headers a preflight may always ask for (CORS-safelisted)
+_SAFELISTED_HEADERS = frozenset({b"accept", b"accept-language", b"content-language", b"content-type"})
+
+
+class PureCORSMiddleware:
+    """CORS handling without Starlette's Request/Response wrapping.
+
+    Header values are encoded once at construction, so the per-request path
+    only scans the raw scope headers and appends pre-built byte pairs.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = ("*",),
+        allow_methods: Sequence[str] = ("*",),
+        allow_headers: Sequence[str] = ("*",),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_header_names = _SAFELISTED_HEADERS | frozenset(h.lower().encode("latin-1") for h in allow_headers)
+        self.allow_credentials = allow_credentials
+
+        methods = _ALL_METHODS if "*" in allow_methods else allow_methods
+        self.allow_methods = frozenset(m.encode("latin-1") for m in methods)
+        self.preflight_headers: List[tuple] = [
+            (b"access-control-allow-methods", ", ".join(methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if not self.allow_all_headers:
+            self.preflight_headers.append(
+                (b"access-control-allow-headers", ", ".join(allow_headers).encode("latin-1"))
+            )
+        self.credentials_header = (b"access-control-allow-credentials", b"true")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers: Dict[bytes, bytes] = dict(scope["headers"])
+        origin = headers.get(b"origin")
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        origin_allowed = self.allow_all_origins or origin in self.allow_origins
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in headers:
+            await self._preflight(origin, origin_allowed, headers, send)
+            return
+        if not origin_allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = self._origin_headers(origin)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _preflight(self, origin: bytes, origin_allowed: bool, headers: Dict[bytes, bytes], send: Send) -> None:
+        """Answer a preflight: 200 if origin, method and headers are all allowed, else 400."""
+        failures = []
+        if not origin_allowed:
+            failures.append("origin")
+        if headers[b"access-control-request-method"] not in self.allow_methods:
+            failures.append("method")
+        requested = headers.get(b"access-control-request-headers")
+        if requested and not self.allow_all_headers:
+            for name in requested.split(b","):
+                if name.strip().lower() not in self.allow_header_names:
+                    failures.append("headers")
+                    break
+
+        response_headers = self.preflight_headers.copy()
+        if origin_allowed:
+            response_headers[:0] = self._origin_headers(origin)
+        if self.allow_all_headers and requested:
+            response_headers.append((b"access-control-allow-headers", requested))
+        if failures:
+            status = 400
+            body = ("Disallowed CORS " + ", ".join(failures)).encode("latin-1")
+            response_headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        else:
+            status, body = 200, b""
+        response_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": response_headers})
+        await send({"type": "http.response.body", "body": body})
+
+    def _origin_headers(self, origin: bytes) -> List[tuple]:
+        # Browsers reject a wildcard origin on credentialed requests, so echo it back
+        if self.allow_all_origins and not self.allow_credentials:
+            return [(b"access-control-allow-origin", b"*")]
+        cors_headers = [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+        if self.allow_credentials:
+            cors_headers.append(self.credentials_header)
+        return cors_headers
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class Priority(str, Enum):
@@ -15,6 +15,10 @@ class Priority(str, Enum):
     HIGH = "High"
     CRITICAL = "Critical"
 
+    def __str__(self) -> str:
+        # Render as the plain value in f-strings on every Python version
+        return self.value
+
 
 class IssueType(str, Enum):
     """Jira issue types."""
@@ -25,6 +29,9 @@ class IssueType(str, Enum):
     INCIDENT = "[System] Incident"
     SERVICE_REQUEST = "[System] Service request"
 
+    def __str__(self) -> str:
+        return self.value
+
 
 class TeamMember(BaseModel):
     """Team member information."""
@@ -194,3 +201,8 @@ class SprintCreationResponse(BaseModel):
     message: str = Field(..., description="Human-readable message")
     data: Optional[SprintCreationResult] = Field(None, description="Sprint creation results")
     error: Optional[str] = Field(None, description="Error message if failed")
+
+
+# Serializers built once at import time and reused for every response
+EXECUTION_RESULT_ADAPTER = TypeAdapter(ProjectExecutionResult)
+REQUIREMENT_BREAKDOWN_LIST_ADAPTER = TypeAdapter(List[RequirementBreakdown])
@@ -1,13 +1,19 @@
 """Project orchestrator for breaking down requirements and creating Jira/Confluence content."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from ..core.google_agent_development_kit_coordinator import GoogleAgentDevelopmentKitCoordinator
+from ..core.types import AgentResponse, Command, CommandType
+from ..models.confluence import ConfluencePage
+from ..models.jira import JiraIssue
 from .models import (
+    EXECUTION_RESULT_ADAPTER,
     GeneratedConfluencePage,
     GeneratedJiraIssue,
     ProjectExecutionResult,
@@ -20,6 +26,66 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Link templates for generated artifacts; override the site for other tenants
+ATLASSIAN_SITE_URL = os.getenv("ATLASSIAN_SITE_URL", "https://athonprompt.atlassian.net").rstrip("/")
+JIRA_BROWSE_URL = ATLASSIAN_SITE_URL + "/browse/"
+CONFLUENCE_PAGE_URL = ATLASSIAN_SITE_URL + "/wiki/spaces/{space_key}/pages/{page_id}"
+
+# Upper bound on concurrent LLM calls when breaking down requirements
+_MAX_CONCURRENT_BREAKDOWNS = 8
+
+# Upper bound on concurrent Jira issue creations per project execution
+_MAX_CONCURRENT_ISSUE_CREATES = 8
+
+# Executions kept in memory; the oldest are dropped first
+_MAX_EXECUTION_HISTORY = 10_000
+
+
+def suggest_assignees(
+    requirement: ProjectRequirement, team_members: List[TeamMember]
+) -> List[TeamMemberSuggestion]:
+    """Suggest team members for a requirement based on skills and capacity.
+
+    Kept at module level with concrete annotations so it can be compiled
+    with mypyc alongside the other pure helpers in this module.
+    """
+    suggestions: List[TeamMemberSuggestion] = []
+
+    # Lowercase the required skills once rather than per team member
+    required_skills = requirement.required_skills
+    required_lower: List[str] = [skill.lower() for skill in required_skills]
+
+    for member in team_members:
+        # Calculate skill match score
+        match_score: float
+        if required_skills:
+            member_lower = frozenset(s.lower() for s in member.skills)
+            matching_skills = [
+                skill for skill, lower in zip(required_skills, required_lower)
+                if lower in member_lower
+            ]
+            match_score = len(matching_skills) / len(required_skills)
+        else:
+            matching_skills = []
+            match_score = 0.5  # Default score when no specific skills required
+
+        # Factor in capacity
+        availability_bonus = member.capacity * 0.3
+        final_score = min(1.0, match_score + availability_bonus)
+
+        suggestion = TeamMemberSuggestion(
+            username=member.username,
+            display_name=member.display_name,
+            match_score=final_score,
+            matching_skills=matching_skills,
+            current_workload=1.0 - member.capacity,
+        )
+        suggestions.append(suggestion)
+
+    # Sort by match score (best matches first)
+    suggestions.sort(key=lambda x: x.match_score, reverse=True)
+    return suggestions
+
 
 class ProjectOrchestrator:
     """Orchestrates project breakdown and execution using AI agents."""
@@ -27,6 +93,8 @@ class ProjectOrchestrator:
     def __init__(self):
         self.coordinator = GoogleAgentDevelopmentKitCoordinator()
         self.execution_history: Dict[str, ProjectExecutionResult] = {}
+        # Serialized results, evicted together with their history entry
+        self._execution_json: Dict[str, bytes] = {}
 
     async def initialize(self) -> bool:
         """Initialize the coordinator and agents."""
@@ -81,43 +149,61 @@ class ProjectOrchestrator:
             result.status = "failed"
             result.errors.append(str(e))
 
-        # Store execution history
+        # Store execution history (dicts keep insertion order, so the first key is the oldest)
         self.execution_history[execution_id] = result
+        if len(self.execution_history) > _MAX_EXECUTION_HISTORY:
+            oldest = next(iter(self.execution_history))
+            del self.execution_history[oldest]
+            self._execution_json.pop(oldest, None)
         return result
 
     async def _break_down_requirements(
         self, project_request: ProjectRequest
     ) -> List[RequirementBreakdown]:
         """Use AI to break down high-level requirements into specific tasks."""
-        breakdowns = []
+        # Requirements are independent, so analyse them concurrently while
+        # capping how many LLM calls are in flight at once
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_BREAKDOWNS)
+        return list(
+            await asyncio.gather(
+                *(
+                    self._break_down_requirement(requirement, project_request, semaphore)
+                    for requirement in project_request.requirements
+                )
+            )
+        )
 
-        for requirement in project_request.requirements:
+    async def _break_down_requirement(
+        self,
+        requirement: ProjectRequirement,
+        project_request: ProjectRequest,
+        semaphore: asyncio.Semaphore,
+    ) -> RequirementBreakdown:
+        """Break down a single requirement."""
+        async with semaphore:
             logger.info(f"🔍 Analyzing requirement: {requirement.title}")
 
             # Use AI to break down the requirement
             prompt = self._build_breakdown_prompt(requirement, project_request)
             responses = await self.coordinator.chat_execute(prompt)
 
-            # For now, create a simple breakdown
-            # In a real implementation, this would parse AI response
-            breakdown = RequirementBreakdown(
-                original_requirement=requirement.title,
-                suggested_tasks=[
-                    {
-                        "title": f"Implement {requirement.title}",
-                        "description": requirement.description,
-                        "priority": requirement.priority.value,
-                        "estimated_hours": requirement.estimated_hours or 8,
-                    }
-                ],
-                suggested_assignees=self._suggest_assignees(
-                    requirement, project_request.team_members
-                ),
-                estimated_total_hours=requirement.estimated_hours or 8,
-            )
-            breakdowns.append(breakdown)
-
-        return breakdowns
+        # For now, create a simple breakdown
+        # In a real implementation, this would parse AI response
+        return RequirementBreakdown(
+            original_requirement=requirement.title,
+            suggested_tasks=[
+                {
+                    "title": f"Implement {requirement.title}",
+                    "description": requirement.description,
+                    "priority": requirement.priority,
+                    "estimated_hours": requirement.estimated_hours or 8,
+                }
+            ],
+            suggested_assignees=self._suggest_assignees(
+                requirement, project_request.team_members
+            ),
+            estimated_total_hours=requirement.estimated_hours or 8,
+        )
 
     async def _create_confluence_documentation(
         self, project_request: ProjectRequest, breakdowns: List[RequirementBreakdown]
@@ -125,41 +211,45 @@ class ProjectOrchestrator:
         """Create Confluence documentation for the project."""
         pages = []
 
-        # Create main project overview page
-        overview_content = self._build_project_overview_content(project_request, breakdowns)
+        # Create main project overview page (content built off the event loop)
+        overview_content = await asyncio.to_thread(
+            self._build_project_overview_content, project_request, breakdowns
+        )
         
-        responses = await self.coordinator.chat_execute(
-            f"Create a Confluence page in space '{project_request.confluence_space_key}' "
-            f"titled '{project_request.project_name} - Project Overview' "
-            f"with content: {overview_content}"
+        responses = await self._create_confluence_page(
+            project_request.confluence_space_key,
+            f"{project_request.project_name} - Project Overview",
+            overview_content,
         )
 
         for response in responses:
-            if response.success and hasattr(response.data, 'id'):
+            if response.success and isinstance(response.data, ConfluencePage):
                 page = GeneratedConfluencePage(
                     id=response.data.id,
                     title=response.data.title,
                     space_key=response.data.space_key,
-                    url=f"https://athonprompt.atlassian.net/wiki/spaces/{response.data.space_key}/pages/{response.data.id}"
+                    url=CONFLUENCE_PAGE_URL.format(space_key=response.data.space_key, page_id=response.data.id),
                 )
                 pages.append(page)
 
         # Create technical requirements page
-        tech_content = self._build_technical_requirements_content(breakdowns)
+        tech_content = await asyncio.to_thread(
+            self._build_technical_requirements_content, breakdowns
+        )
         
-        responses = await self.coordinator.chat_execute(
-            f"Create a Confluence page in space '{project_request.confluence_space_key}' "
-            f"titled '{project_request.project_name} - Technical Requirements' "
-            f"with content: {tech_content}"
+        responses = await self._create_confluence_page(
+            project_request.confluence_space_key,
+            f"{project_request.project_name} - Technical Requirements",
+            tech_content,
         )
 
         for response in responses:
-            if response.success and hasattr(response.data, 'id'):
+            if response.success and isinstance(response.data, ConfluencePage):
                 page = GeneratedConfluencePage(
                     id=response.data.id,
                     title=response.data.title,
                     space_key=response.data.space_key,
-                    url=f"https://athonprompt.atlassian.net/wiki/spaces/{response.data.space_key}/pages/{response.data.id}"
+                    url=CONFLUENCE_PAGE_URL.format(space_key=response.data.space_key, page_id=response.data.id),
                 )
                 pages.append(page)
 
@@ -169,47 +259,87 @@ class ProjectOrchestrator:
         self, project_request: ProjectRequest, breakdowns: List[RequirementBreakdown]
     ) -> Tuple[List[GeneratedJiraIssue], Dict[str, List[str]]]:
         """Create Jira issues based on requirement breakdowns."""
-        issues = []
-        team_assignments: Dict[str, List[str]] = {}
+        # Issues are independent, so create them concurrently; the semaphore is
+        # taken per issue, capping in-flight Jira requests rather than batches
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ISSUE_CREATES)
+        created = await asyncio.gather(
+            *(
+                self._create_jira_issue(project_request, breakdown, task, semaphore)
+                for breakdown in breakdowns
+                for task in breakdown.suggested_tasks
+            )
+        )
 
-        for breakdown in breakdowns:
-            for task in breakdown.suggested_tasks:
-                # Determine assignee
-                assignee = None
-                if project_request.auto_assign and breakdown.suggested_assignees:
-                    assignee = breakdown.suggested_assignees[0].username
-
-                # Create Jira issue
-                responses = await self.coordinator.chat_execute(
-                    f"Create a Jira issue in project '{project_request.jira_project_key}' "
-                    f"with summary '{task['title']}' "
-                    f"and description '{task['description']}' "
-                    f"Set priority to '{task['priority']}' and issue type to 'Task'"
-                    + (f" and assign to '{assignee}'" if assignee else "")
-                )
+        issues: List[GeneratedJiraIssue] = []
+        team_assignments: Dict[str, List[str]] = {}
+        for assignee, task_issues in created:
+            issues.extend(task_issues)
 
-                for response in responses:
-                    if response.success and hasattr(response.data, 'key'):
-                        issue = GeneratedJiraIssue(
-                            key=response.data.key,
-                            title=response.data.summary,
-                            description=response.data.description or "",
-                            assignee=response.data.assignee,
-                            priority=response.data.priority,
-                            issue_type=response.data.issue_type,
-                            estimated_hours=task.get('estimated_hours'),
-                            url=f"https://athonprompt.atlassian.net/browse/{response.data.key}"
-                        )
-                        issues.append(issue)
-
-                        # Track team assignments
-                        if assignee:
-                            if assignee not in team_assignments:
-                                team_assignments[assignee] = []
-                            team_assignments[assignee].append(response.data.key)
+            # Track team assignments
+            if assignee and task_issues:
+                team_assignments.setdefault(assignee, []).extend(issue.key for issue in task_issues)
 
         return issues, team_assignments
 
+    async def _create_jira_issue(
+        self,
+        project_request: ProjectRequest,
+        breakdown: RequirementBreakdown,
+        task: Dict,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[Optional[str], List[GeneratedJiraIssue]]:
+        """Create the Jira issue for a single task; returns the requested assignee and created issues."""
+        # Determine assignee
+        assignee = None
+        if project_request.auto_assign and breakdown.suggested_assignees:
+            assignee = breakdown.suggested_assignees[0].username
+
+        # Create Jira issue directly; the fields are already known
+        async with semaphore:
+            responses = await self.coordinator.execute_command(
+                Command(
+                    command_id=str(uuid.uuid4()),
+                    command_type=CommandType.JIRA_ISSUE,
+                    action="create_issue",
+                    parameters={
+                        "project": project_request.jira_project_key,
+                        "summary": task["title"],
+                        "description": task["description"],
+                        "priority": task["priority"],
+                        "issue_type": "Task",
+                        "assignee": assignee,
+                    },
+                )
+            )
+
+        issues = []
+        for response in responses:
+            if response.success and isinstance(response.data, JiraIssue):
+                issues.append(GeneratedJiraIssue(
+                    key=response.data.key,
+                    title=response.data.summary,
+                    description=response.data.description or "",
+                    assignee=response.data.assignee,
+                    priority=response.data.priority,
+                    issue_type=response.data.issue_type,
+                    estimated_hours=task.get('estimated_hours'),
+                    url=JIRA_BROWSE_URL + response.data.key,
+                ))
+        return assignee, issues
+
+    async def _create_confluence_page(
+        self, space_key: str, title: str, content: str
+    ) -> List[AgentResponse]:
+        """Create a Confluence page without routing the request through the LLM."""
+        return await self.coordinator.execute_command(
+            Command(
+                command_id=str(uuid.uuid4()),
+                command_type=CommandType.CONFLUENCE_PAGE,
+                action="create_page",
+                parameters={"title": title, "content": content, "space_key": space_key},
+            )
+        )
+
     def _build_breakdown_prompt(
         self, requirement: ProjectRequirement, project_request: ProjectRequest
     ) -> str:
@@ -219,7 +349,7 @@ class ProjectOrchestrator:
             f"Project: {project_request.project_name}\n"
             f"Requirement: {requirement.title}\n"
             f"Description: {requirement.description}\n"
-            f"Priority: {requirement.priority.value}\n"
+            f"Priority: {requirement.priority}\n"
             f"Required Skills: {', '.join(requirement.required_skills)}\n\n"
             f"Please suggest 2-4 specific tasks that would implement this requirement, "
             f"considering the technical skills needed and estimated effort."
@@ -229,36 +359,16 @@ class ProjectOrchestrator:
         self, requirement: ProjectRequirement, team_members: List[TeamMember]
     ) -> List[TeamMemberSuggestion]:
         """Suggest team members for a requirement based on skills and capacity."""
-        suggestions = []
-
-        for member in team_members:
-            # Calculate skill match score
-            if requirement.required_skills:
-                matching_skills = [
-                    skill for skill in requirement.required_skills 
-                    if skill.lower() in [s.lower() for s in member.skills]
-                ]
-                match_score = len(matching_skills) / len(requirement.required_skills)
-            else:
-                matching_skills = []
-                match_score = 0.5  # Default score when no specific skills required
-
-            # Factor in capacity
-            availability_bonus = member.capacity * 0.3
-            final_score = min(1.0, match_score + availability_bonus)
-
-            suggestion = TeamMemberSuggestion(
-                username=member.username,
-                display_name=member.display_name,
-                match_score=final_score,
-                matching_skills=matching_skills,
-                current_workload=1.0 - member.capacity,
-            )
-            suggestions.append(suggestion)
+        return suggest_assignees(requirement, team_members)
 
-        # Sort by match score (best matches first)
-        suggestions.sort(key=lambda x: x.match_score, reverse=True)
-        return suggestions
+    def suggest_team_assignments(
+        self, project_request: ProjectRequest
+    ) -> Dict[str, List[TeamMemberSuggestion]]:
+        """Suggest assignees for every requirement, keyed by requirement title."""
+        return {
+            requirement.title: suggest_assignees(requirement, project_request.team_members)
+            for requirement in project_request.requirements
+        }
 
     def _build_project_overview_content(
         self, project_request: ProjectRequest, breakdowns: List[RequirementBreakdown]
@@ -293,7 +403,7 @@ class ProjectOrchestrator:
 <ul>
 """
         for req in project_request.requirements:
-            content += f"<li><strong>{req.title}</strong> ({req.priority.value}) - {req.estimated_hours or 'TBD'} hours</li>\n"
+            content += f"<li><strong>{req.title}</strong> ({req.priority}) - {req.estimated_hours or 'TBD'} hours</li>\n"
         
         content += "</ul>"
         return content
@@ -324,6 +434,23 @@ class ProjectOrchestrator:
         """Get execution result by ID."""
         return self.execution_history.get(execution_id)
 
+    def get_execution_json(self, execution_id: str) -> Optional[bytes]:
+        """Get an execution result as JSON bytes, serialized once per execution.
+
+        Only finished results are stored, so the bytes never go stale.
+        """
+        content = self._execution_json.get(execution_id)
+        if content is None:
+            result = self.execution_history.get(execution_id)
+            if result is None:
+                return None
+            content = self._execution_json[execution_id] = EXECUTION_RESULT_ADAPTER.dump_json(result)
+        return content
+
+    def list_executions_json(self) -> bytes:
+        """Get all execution results as one JSON array, reusing the per-execution bytes."""
+        return b"[" + b",".join(map(self.get_execution_json, self.execution_history)) + b"]"
+
     def list_executions(self) -> List[ProjectExecutionResult]:
         """List all execution results."""
         return list(self.execution_history.values())
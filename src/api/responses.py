@@ -0,0 +1,30 @@
+"""Response classes for the AI Scrum Master REST API."""
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastORJSONResponse(JSONResponse):
+    """JSON response rendered directly by orjson.
+
+    Unlike FastAPI's ORJSONResponse, content may contain Pydantic models,
+    which are dumped on demand, so handlers can return models without a
+    jsonable_encoder pass. Dataclasses, enums and datetimes are native to
+    orjson.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
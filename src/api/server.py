@@ -1,16 +1,22 @@
 """FastAPI server for AI Scrum Master REST API."""
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
+import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 
 from .models import (
+    REQUIREMENT_BREAKDOWN_LIST_ADAPTER,
     ErrorResponse,
     GeneratedJiraIssue,
     HealthCheck,
@@ -34,7 +40,11 @@ class ChatResponse(BaseModel):
     response: str = Field(..., description="AI Scrum Master response")
     session_id: str = Field(..., description="Chat session ID")
     timestamp: datetime = Field(default_factory=datetime.now)
-from .project_orchestrator import ProjectOrchestrator
+from .middleware import PureCORSMiddleware
+from .responses import FastORJSONResponse
+from .project_orchestrator import CONFLUENCE_PAGE_URL, JIRA_BROWSE_URL, ProjectOrchestrator
+from ..models.confluence import ConfluencePage
+from ..models.jira import JiraIssue
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +53,69 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prompt templates, filled with str.format_map per request
+_SPRINT_PROMPT_TEMPLATE = """
+As an AI Scrum Master, help me create a sprint with the following information:
+
+Sprint Name: {sprint_name}
+Sprint Goal: {sprint_goal}
+Duration: {duration_weeks} weeks
+Project: {jira_project_key}
+Team Capacity: {team_capacity}%
+
+Requirements and Context:
+{requirements}
+
+{team_info}
+
+Please help me:
+1. Break down the requirements into specific, actionable Jira issues
+2. Estimate story points for each issue
+3. {assign_step}
+4. {documentation_step}
+5. Provide insights on sprint capacity and planning
+6. Create the actual Jira issues in project {jira_project_key}
+
+Focus on creating well-defined, achievable tasks that fit within the sprint timeframe.
+"""
+
+_JIRA_ISSUE_PROMPT_TEMPLATE = (
+    "Create a Jira issue in project '{project_key}' "
+    "with summary '{summary}' "
+    "and description '{description}' "
+    "Set priority to '{priority}' and issue type to '{issue_type}'"
+    "{assignee_clause}"
+)
+
+_CONFLUENCE_PAGE_PROMPT_TEMPLATE = (
+    "Create a Confluence page in space '{space_key}' "
+    "titled '{title}' "
+    "with content: {content}"
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own the project orchestrator for the lifetime of the app."""
+    logger.info("🚀 Starting AI Scrum Master API...")
+    
+    orchestrator = ProjectOrchestrator()
+    init_success = await orchestrator.initialize()
+    app.state.orchestrator = orchestrator
+    
+    if init_success:
+        logger.info("✅ AI Scrum Master API started successfully")
+    else:
+        logger.warning("⚠️ API started but some services may be unavailable")
+    
+    try:
+        yield
+    finally:
+        logger.info("🛑 Shutting down AI Scrum Master API...")
+        await orchestrator.shutdown()
+        logger.info("✅ AI Scrum Master API shutdown complete")
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Scrum Master API",
@@ -50,99 +123,111 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=FastORJSONResponse,
+    lifespan=lifespan,
 )
 
-# Add CORS middleware
+# Add CORS middleware (pure ASGI, no per-request Request/Response objects)
 app.add_middleware(
-    CORSMiddleware,
+    PureCORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Global orchestrator instance
-orchestrator: Optional[ProjectOrchestrator] = None
+# Static chat interface (static/chat/index.html at the repository root)
+_CHAT_STATIC_DIR = Path(__file__).resolve().parents[2] / "static" / "chat"
+
+# Generated chat session IDs: a per-process prefix plus a monotonic counter
+_SESSION_PREFIX = f"session_{int(time.time())}_{os.getpid()}_"
+_session_counter = itertools.count(1)
+
+# Structured sprint payload keys and the SprintCreationResult fields they fill
+_MISSING = object()
+_SPRINT_PLAN_FIELDS = (
+    ("story_points", "total_story_points"),
+    ("estimated_hours", "estimated_hours"),
+    ("assignments", "team_assignments"),
+    ("scrum_master_notes", "scrum_master_notes"),
+    ("capacity_analysis", "capacity_analysis"),
+)
 
+_STATUS_HEALTHY = "healthy"
+_STATUS_DEGRADED = "degraded"
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the project orchestrator on startup."""
-    global orchestrator
-    logger.info("🚀 Starting AI Scrum Master API...")
-    
-    orchestrator = ProjectOrchestrator()
-    init_success = await orchestrator.initialize()
-    
-    if init_success:
-        logger.info("✅ AI Scrum Master API started successfully")
-    else:
-        logger.warning("⚠️ API started but some services may be unavailable")
 
+async def get_orchestrator(request: Request) -> ProjectOrchestrator:
+    """Resolve the app's orchestrator, or fail with 503 if it is not set up.
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    global orchestrator
-    logger.info("🛑 Shutting down AI Scrum Master API...")
-    
-    if orchestrator:
-        await orchestrator.shutdown()
-    
-    logger.info("✅ AI Scrum Master API shutdown complete")
+    Async so FastAPI resolves it on the event loop instead of a threadpool.
+    """
+    orchestrator = getattr(request.app.state, "orchestrator", None)
+    if not orchestrator:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Orchestrator not available"
+        )
+    return orchestrator
+
+
+async def require_jira(orchestrator: ProjectOrchestrator = Depends(get_orchestrator)) -> ProjectOrchestrator:
+    """Like get_orchestrator, but also require a connected Jira service."""
+    if not orchestrator.coordinator.jira_available:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Jira service not available"
+        )
+    return orchestrator
+
+
+async def require_confluence(orchestrator: ProjectOrchestrator = Depends(get_orchestrator)) -> ProjectOrchestrator:
+    """Like get_orchestrator, but also require a connected Confluence service."""
+    if not orchestrator.coordinator.confluence_available:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Confluence service not available"
+        )
+    return orchestrator
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
     logger.error(f"❌ Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return FastORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=ErrorResponse(
             error="Internal server error",
             details=str(exc)
-        ).dict()
+        )
     )
 
 
-# Chat interface endpoint
-@app.get("/chat", response_class=HTMLResponse)
-async def chat_interface():
-    """Serve the chat interface HTML."""
-    try:
-        with open("chat_interface.html", "r", encoding="utf-8") as f:
-            html_content = f.read()
-        return HTMLResponse(content=html_content)
-    except FileNotFoundError:
-        return HTMLResponse(content="<h1>Chat interface not found</h1>", status_code=404)
+# Chat interface, served straight from disk by StaticFiles (sendfile, no
+# Python-side body handling); /chat redirects to /chat/ and serves index.html
+app.mount("/chat", StaticFiles(directory=_CHAT_STATIC_DIR, html=True), name="chat")
 
 # Health check endpoint
 @app.get("/health", response_model=HealthCheck)
-async def health_check():
+async def health_check(request: Request):
     """Check API and service health."""
-    global orchestrator
-    
-    services = {
-        "api": True,
-        "jira": False,
-        "confluence": False,
-    }
-    
-    if orchestrator:
-        services["jira"] = orchestrator.coordinator.jira_available
-        services["confluence"] = orchestrator.coordinator.confluence_available
-    
-    overall_status = "healthy" if all(services.values()) else "degraded"
+    # Startup may have failed or not finished yet; report degraded, not a 500
+    orchestrator = getattr(request.app.state, "orchestrator", None)
+    jira_ok = confluence_ok = False
+    if orchestrator is not None:
+        jira_ok = orchestrator.coordinator.jira_available
+        confluence_ok = orchestrator.coordinator.confluence_available
     
     return HealthCheck(
-        status=overall_status,
-        services=services,
+        status=_STATUS_HEALTHY if jira_ok and confluence_ok else _STATUS_DEGRADED,
+        services={"api": True, "jira": jira_ok, "confluence": confluence_ok},
     )
 
 
 # Main project execution endpoint
 @app.post("/api/v1/projects/execute", response_model=ProjectExecutionResponse)
-async def execute_project(project_request: ProjectRequest):
+async def execute_project(project_request: ProjectRequest, orchestrator: ProjectOrchestrator = Depends(get_orchestrator)):
     """
     Execute a complete project request.
     
@@ -154,32 +239,25 @@ async def execute_project(project_request: ProjectRequest):
     
     Returns execution results with created issues and pages.
     """
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
     logger.info(f"📥 Received project execution request: {project_request.project_name}")
     
     try:
         result = await orchestrator.execute_project(project_request)
         
+        # Returned as a response so the model goes straight to orjson bytes
         if result.status == "completed":
-            return ProjectExecutionResponse(
+            return FastORJSONResponse(ProjectExecutionResponse(
                 success=True,
                 message=f"Project '{project_request.project_name}' executed successfully",
                 data=result
-            )
+            ))
         else:
-            return ProjectExecutionResponse(
+            return FastORJSONResponse(ProjectExecutionResponse(
                 success=False,
                 message=f"Project execution failed: {', '.join(result.errors)}",
                 data=result,
                 error=", ".join(result.errors) if result.errors else "Unknown error"
-            )
+            ))
     
     except Exception as e:
         logger.error(f"❌ Project execution error: {str(e)}")
@@ -191,63 +269,42 @@ async def execute_project(project_request: ProjectRequest):
 
 # Get execution result by ID
 @app.get("/api/v1/projects/executions/{execution_id}")
-async def get_execution_result(execution_id: str):
+async def get_execution_result(execution_id: str, orchestrator: ProjectOrchestrator = Depends(get_orchestrator)):
     """Get execution result by ID."""
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
-    result = orchestrator.get_execution_result(execution_id)
-    if not result:
+    content = orchestrator.get_execution_json(execution_id)
+    if content is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Execution not found"
         )
-    
-    return result
+    return Response(content=content, media_type="application/json")
 
 
 # List all executions
 @app.get("/api/v1/projects/executions")
-async def list_executions():
+async def list_executions(orchestrator: ProjectOrchestrator = Depends(get_orchestrator)):
     """List all project executions."""
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
-    return orchestrator.list_executions()
+    return Response(content=orchestrator.list_executions_json(), media_type="application/json")
 
 
 # Requirement breakdown endpoint (for preview)
 @app.post("/api/v1/projects/breakdown", response_model=List[RequirementBreakdown])
-async def preview_requirement_breakdown(project_request: ProjectRequest):
+async def preview_requirement_breakdown(project_request: ProjectRequest, orchestrator: ProjectOrchestrator = Depends(get_orchestrator)):
     """
     Preview how requirements would be broken down without executing.
     
     Useful for clients to see suggested task breakdown and assignments
     before executing the full project.
     """
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
     logger.info(f"📋 Generating requirement breakdown preview for: {project_request.project_name}")
     
     try:
         breakdowns = await orchestrator._break_down_requirements(project_request)
-        return breakdowns
+        # response_model stays for the OpenAPI schema; serialize via the cached adapter
+        return Response(
+            content=REQUIREMENT_BREAKDOWN_LIST_ADAPTER.dump_json(breakdowns),
+            media_type="application/json",
+        )
     
     except Exception as e:
         logger.error(f"❌ Breakdown preview error: {str(e)}")
@@ -259,31 +316,19 @@ async def preview_requirement_breakdown(project_request: ProjectRequest):
 
 # Team assignment suggestions endpoint
 @app.post("/api/v1/projects/team-suggestions")
-async def get_team_suggestions(project_request: ProjectRequest):
+async def get_team_suggestions(project_request: ProjectRequest, orchestrator: ProjectOrchestrator = Depends(get_orchestrator)):
     """
     Get team assignment suggestions for each requirement.
     
     Returns suggested assignees based on skills and capacity
     without creating any Jira issues.
     """
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
     logger.info(f"👥 Generating team suggestions for: {project_request.project_name}")
     
     try:
-        suggestions = {}
-        for requirement in project_request.requirements:
-            suggestions[requirement.title] = orchestrator._suggest_assignees(
-                requirement, project_request.team_members
-            )
-        
-        return suggestions
+        # Pure CPU scoring: hand the whole batch to one worker thread
+        suggestions = await asyncio.to_thread(orchestrator.suggest_team_assignments, project_request)
+        return FastORJSONResponse(suggestions)
     
     except Exception as e:
         logger.error(f"❌ Team suggestions error: {str(e)}")
@@ -302,46 +347,32 @@ async def create_jira_issue(
     issue_type: str = "Task",
     priority: str = "Medium",
     assignee: Optional[str] = None,
+    orchestrator: ProjectOrchestrator = Depends(require_jira),
 ):
     """Create a single Jira issue."""
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
-    if not orchestrator.coordinator.jira_available:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Jira service not available"
-        )
-    
     logger.info(f"🎫 Creating Jira issue: {summary}")
     
     try:
-        prompt = (
-            f"Create a Jira issue in project '{project_key}' "
-            f"with summary '{summary}' "
-            f"and description '{description}' "
-            f"Set priority to '{priority}' and issue type to '{issue_type}'"
-        )
-        
-        if assignee:
-            prompt += f" and assign to '{assignee}'"
+        prompt = _JIRA_ISSUE_PROMPT_TEMPLATE.format_map({
+            "project_key": project_key,
+            "summary": summary,
+            "description": description,
+            "priority": priority,
+            "issue_type": issue_type,
+            "assignee_clause": f" and assign to '{assignee}'" if assignee else "",
+        })
         
         responses = await orchestrator.coordinator.chat_execute(prompt)
         
         for response in responses:
-            if response.success and hasattr(response.data, 'key'):
+            if response.success and isinstance(response.data, JiraIssue):
                 return {
                     "success": True,
                     "issue": {
                         "key": response.data.key,
                         "summary": response.data.summary,
                         "assignee": response.data.assignee,
-                        "url": f"https://athonprompt.atlassian.net/browse/{response.data.key}"
+                        "url": JIRA_BROWSE_URL + response.data.key
                     }
                 }
         
@@ -365,42 +396,29 @@ async def create_confluence_page(
     title: str,
     content: str,
     parent_id: Optional[str] = None,
+    orchestrator: ProjectOrchestrator = Depends(require_confluence),
 ):
     """Create a single Confluence page."""
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
-    if not orchestrator.coordinator.confluence_available:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Confluence service not available"
-        )
-    
     logger.info(f"📄 Creating Confluence page: {title}")
     
     try:
-        prompt = (
-            f"Create a Confluence page in space '{space_key}' "
-            f"titled '{title}' "
-            f"with content: {content}"
-        )
+        prompt = _CONFLUENCE_PAGE_PROMPT_TEMPLATE.format_map({
+            "space_key": space_key,
+            "title": title,
+            "content": content,
+        })
         
         responses = await orchestrator.coordinator.chat_execute(prompt)
         
         for response in responses:
-            if response.success and hasattr(response.data, 'id'):
+            if response.success and isinstance(response.data, ConfluencePage):
                 return {
                     "success": True,
                     "page": {
                         "id": response.data.id,
                         "title": response.data.title,
                         "space_key": response.data.space_key,
-                        "url": f"https://athonprompt.atlassian.net/wiki/spaces/{response.data.space_key}/pages/{response.data.id}"
+                        "url": CONFLUENCE_PAGE_URL.format(space_key=response.data.space_key, page_id=response.data.id)
                     }
                 }
         
@@ -419,7 +437,7 @@ async def create_confluence_page(
 
 # Sprint creation endpoint
 @app.post("/api/v1/sprints/create", response_model=SprintCreationResponse)
-async def create_sprint(sprint_request: SprintCreationRequest):
+async def create_sprint(sprint_request: SprintCreationRequest, orchestrator: ProjectOrchestrator = Depends(get_orchestrator)):
     """
     Create a new sprint with AI assistance.
     
@@ -434,49 +452,36 @@ async def create_sprint(sprint_request: SprintCreationRequest):
     
     Returns comprehensive sprint setup results.
     """
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
     logger.info(f"🏃‍♂️ Creating sprint: {sprint_request.sprint_name}")
     
     try:
         # Create comprehensive prompt for AI Scrum Master
         team_info = ""
         if sprint_request.team_members:
-            team_info = f"\nTeam members available:\n"
-            for member in sprint_request.team_members:
-                skills_str = ", ".join(member.skills) if member.skills else "No specific skills listed"
-                team_info += f"- {member.display_name} ({member.username}): {skills_str}, capacity: {member.capacity * 100}%\n"
+            team_info = "\nTeam members available:\n" + "".join(
+                f"- {member.display_name} ({member.username}): "
+                f"{', '.join(member.skills) if member.skills else 'No specific skills listed'}, "
+                f"capacity: {member.capacity * 100}%\n"
+                for member in sprint_request.team_members
+            )
         
-        prompt = f"""
-As an AI Scrum Master, help me create a sprint with the following information:
-
-Sprint Name: {sprint_request.sprint_name}
-Sprint Goal: {sprint_request.sprint_goal}
-Duration: {sprint_request.duration_weeks} weeks
-Project: {sprint_request.jira_project_key}
-Team Capacity: {sprint_request.team_capacity * 100}%
-
-Requirements and Context:
-{sprint_request.requirements}
-
-{team_info}
-
-Please help me:
-1. Break down the requirements into specific, actionable Jira issues
-2. Estimate story points for each issue
-3. {"Assign tasks to appropriate team members based on their skills and capacity" if sprint_request.auto_assign_tasks else "Suggest appropriate assignees"}
-4. {"Create sprint planning documentation" if sprint_request.create_documentation else "Skip documentation creation"}
-5. Provide insights on sprint capacity and planning
-6. Create the actual Jira issues in project {sprint_request.jira_project_key}
-
-Focus on creating well-defined, achievable tasks that fit within the sprint timeframe.
-"""
+        prompt = _SPRINT_PROMPT_TEMPLATE.format_map({
+            "sprint_name": sprint_request.sprint_name,
+            "sprint_goal": sprint_request.sprint_goal,
+            "duration_weeks": sprint_request.duration_weeks,
+            "jira_project_key": sprint_request.jira_project_key,
+            "team_capacity": sprint_request.team_capacity * 100,
+            "requirements": sprint_request.requirements,
+            "team_info": team_info,
+            "assign_step": (
+                "Assign tasks to appropriate team members based on their skills and capacity"
+                if sprint_request.auto_assign_tasks else "Suggest appropriate assignees"
+            ),
+            "documentation_step": (
+                "Create sprint planning documentation"
+                if sprint_request.create_documentation else "Skip documentation creation"
+            ),
+        })
         
         # Execute with AI Scrum Master
         responses = await orchestrator.coordinator.chat_execute(prompt)
@@ -491,31 +496,24 @@ Focus on creating well-defined, achievable tasks that fit within the sprint time
             if response.success:
                 if isinstance(response.data, dict):
                     # Extract issue information if available
-                    if "issues" in response.data:
-                        for issue_data in response.data.get("issues", []):
-                            if hasattr(issue_data, 'key'):
-                                result.jira_issues.append(GeneratedJiraIssue(
-                                    key=issue_data.key,
-                                    title=issue_data.summary,
-                                    description=getattr(issue_data, 'description', ''),
-                                    assignee=getattr(issue_data, 'assignee', None),
-                                    priority=getattr(issue_data, 'priority', 'Medium'),
-                                    issue_type=getattr(issue_data, 'issue_type', 'Task'),
-                                    estimated_hours=getattr(issue_data, 'estimated_hours', None),
-                                    url=f"https://athonprompt.atlassian.net/browse/{issue_data.key}"
-                                ))
-                    
-                    # Extract other planning information
-                    if "story_points" in response.data:
-                        result.total_story_points = response.data.get("story_points", 0)
-                    if "estimated_hours" in response.data:
-                        result.estimated_hours = response.data.get("estimated_hours", 0)
-                    if "assignments" in response.data:
-                        result.team_assignments = response.data.get("assignments", {})
-                    if "scrum_master_notes" in response.data:
-                        result.scrum_master_notes = response.data.get("scrum_master_notes", [])
-                    if "capacity_analysis" in response.data:
-                        result.capacity_analysis = response.data.get("capacity_analysis", "")
+                    for issue_data in response.data.get("issues", ()):
+                        if isinstance(issue_data, JiraIssue):
+                            result.jira_issues.append(GeneratedJiraIssue(
+                                key=issue_data.key,
+                                title=issue_data.summary,
+                                description=issue_data.description or "",
+                                assignee=issue_data.assignee,
+                                priority=issue_data.priority,
+                                issue_type=issue_data.issue_type,
+                                estimated_hours=None,
+                                url=JIRA_BROWSE_URL + issue_data.key
+                            ))
+                
+                    # Extract other planning information (one probe per key)
+                    for key, field_name in _SPRINT_PLAN_FIELDS:
+                        value = response.data.get(key, _MISSING)
+                        if value is not _MISSING:
+                            setattr(result, field_name, value)
                 
                 # Add general success message if we got a string response
                 elif isinstance(response.data, str):
@@ -560,7 +558,7 @@ Focus on creating well-defined, achievable tasks that fit within the sprint time
 
 # Chat endpoint for direct interaction with AI Scrum Master
 @app.post("/api/v1/chat", response_model=ChatResponse)
-async def chat_with_scrum_master(chat_message: ChatMessage):
+async def chat_with_scrum_master(chat_message: ChatMessage, orchestrator: ProjectOrchestrator = Depends(get_orchestrator)):
     """
     Chat directly with the AI Scrum Master.
     
@@ -568,16 +566,8 @@ async def chat_with_scrum_master(chat_message: ChatMessage):
     for sprint planning, task breakdown, team coordination, and general
     Scrum guidance.
     """
-    global orchestrator
-    
-    if not orchestrator:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Orchestrator not available"
-        )
-    
     # Generate session ID if not provided
-    session_id = chat_message.session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    session_id = chat_message.session_id or f"{_SESSION_PREFIX}{next(_session_counter)}"
     
     logger.info(f"💬 Chat request: {chat_message.message[:100]}...")
     
@@ -586,37 +576,43 @@ async def chat_with_scrum_master(chat_message: ChatMessage):
         responses = await orchestrator.coordinator.chat_execute(chat_message.message)
         
         # Combine all responses into a single chat response
-        combined_response = ""
+        parts: List[str] = []
         for response in responses:
             if response.success:
                 if isinstance(response.data, str):
-                    combined_response += f"{response.data}\n\n"
+                    parts.append(f"{response.data}\n\n")
                 elif isinstance(response.data, dict):
-                    # Format structured data nicely
-                    if "issues" in response.data:
-                        combined_response += "🎫 **Created Issues:**\n"
-                        for issue in response.data.get("issues", []):
-                            combined_response += f"- {issue.get('key', 'N/A')}: {issue.get('summary', 'No title')}\n"
-                        combined_response += "\n"
+                    # Format structured data nicely (one probe per section key)
+                    issues = response.data.get("issues", _MISSING)
+                    if issues is not _MISSING:
+                        parts.append("🎫 **Created Issues:**\n")
+                        parts.extend(
+                            f"- {issue.get('key', 'N/A')}: {issue.get('summary', 'No title')}\n"
+                            for issue in issues
+                        )
+                        parts.append("\n")
                     
-                    if "scrum_master_notes" in response.data:
-                        combined_response += "🤖 **Scrum Master Insights:**\n"
-                        for note in response.data.get("scrum_master_notes", []):
-                            combined_response += f"- {note}\n"
-                        combined_response += "\n"
+                    notes = response.data.get("scrum_master_notes", _MISSING)
+                    if notes is not _MISSING:
+                        parts.append("🤖 **Scrum Master Insights:**\n")
+                        parts.extend(f"- {note}\n" for note in notes)
+                        parts.append("\n")
                     
-                    if "assignments" in response.data:
-                        combined_response += "👥 **Team Assignments:**\n"
-                        for member, tasks in response.data.get("assignments", {}).items():
-                            combined_response += f"- {member}: {len(tasks)} task(s)\n"
-                        combined_response += "\n"
+                    assignments = response.data.get("assignments", _MISSING)
+                    if assignments is not _MISSING:
+                        parts.append("👥 **Team Assignments:**\n")
+                        parts.extend(
+                            f"- {member}: {len(tasks)} task(s)\n"
+                            for member, tasks in assignments.items()
+                        )
+                        parts.append("\n")
                 else:
-                    combined_response += f"{response.data}\n\n"
+                    parts.append(f"{response.data}\n\n")
             else:
-                combined_response += f"❌ {response.agent_name}: {response.error_message}\n\n"
+                parts.append(f"❌ {response.agent_name}: {response.error_message}\n\n")
         
         # Clean up the response
-        combined_response = combined_response.strip()
+        combined_response = "".join(parts).strip()
         if not combined_response:
             combined_response = "🤖 I'm here to help with your Scrum processes! Please let me know what you need assistance with."
         
@@ -659,13 +655,28 @@ async def api_info():
     }
 
 
+def uvicorn_options() -> Dict[str, Any]:
+    """Keyword arguments for uvicorn.run(), shared by both launchers.
+
+    Auto-reload only in development (DEV=true). Outside development a single
+    worker runs unless WEB_CONCURRENCY is set: execution history and its
+    serialized cache live in each worker's orchestrator, so a result written
+    by one worker would 404 on another.
+    """
+    dev_mode = os.getenv("DEV", "false").lower() == "true"
+    return {
+        "host": "0.0.0.0",
+        "port": 8000,
+        "reload": dev_mode,
+        "workers": 1 if dev_mode else int(os.getenv("WEB_CONCURRENCY") or 1),
+        # uvloop/httptools when installed, the stdlib fallbacks otherwise (Windows)
+        "loop": "auto",
+        "http": "auto",
+        "log_level": "info",
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     
-    uvicorn.run(
-        "src.api.server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+    uvicorn.run("src.api.server:app", **uvicorn_options())
@@ -0,0 +1,82 @@
+"""Small in-memory caches shared by the coordinators and LLM wrappers."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class TTLCache:
+    """Exact-match, in-memory cache with a per-entry TTL and LRU eviction."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[bool]"] = {}
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Any,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        ttl_for: Optional[Callable[[Any], float]] = None,
+    ) -> Any:
+        """Return the cached value, or await fetch() once for all concurrent callers.
+
+        When cacheable is given, a fetched value is only stored if it returns
+        True; ttl_for, when given, picks the stored value's TTL. Callers that were waiting on a fetch whose value was not stored
+        (or that failed) then fetch for themselves, concurrently.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Shielded: a cancelled waiter must not cancel the shared future
+            if await asyncio.shield(inflight):
+                cached = self.get(key)
+                if cached is not None:
+                    return cached
+            return await fetch()
+
+        # Resolves to whether the value was stored; removed only once resolved
+        future: "asyncio.Future[bool]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        stored = False
+        try:
+            value = await fetch()
+            if cacheable is None or cacheable(value):
+                self.set(key, value, None if ttl_for is None else ttl_for(value))
+                stored = True
+            return value
+        finally:
+            del self._inflight[key]
+            future.set_result(stored)
@@ -5,12 +5,14 @@ by the existing MCP-based agents.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional
 
-from litellm import completion
-from .llm_agent import LlmAgent, LiteLlm
+import orjson
+
+from .llm_agent import LlmAgent, LiteLlm, freeze_tools, temperature_from_env
 
 from .types import AgentResponse, Command, CommandType
 from ..agents.jira_agent import JiraAgent
@@ -18,6 +20,134 @@ from ..agents.confluence_agent import ConfluenceAgent
 
 logger = logging.getLogger(__name__)
 
+# LLM tool schemas for the Jira and Confluence agents
+_TOOL_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "jira_get_issues",
+            "description": "Retrieve Jira issues with optional filters",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "project": {"type": "string"},
+                    "status": {"type": "string"},
+                    "assignee": {"type": "string"},
+                    "issue_type": {"type": "string"},
+                    "max_results": {"type": "integer", "default": 50},
+                },
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "jira_create_issue",
+            "description": "Create a new Jira issue",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "project": {"type": "string"},
+                    "summary": {"type": "string"},
+                    "description": {"type": "string"},
+                    "issue_type": {"type": "string", "default": "Task"},
+                    "priority": {"type": "string", "default": "Medium"},
+                    "assignee": {"type": "string"},
+                    "labels": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["project", "summary"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "jira_update_issue",
+            "description": "Update an existing Jira issue by key",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "issue_key": {"type": "string"},
+                    "updates": {"type": "object"},
+                },
+                "required": ["issue_key", "updates"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "confluence_get_page",
+            "description": "Retrieve a Confluence page by id/title/space",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "page_id": {"type": "string"},
+                    "title": {"type": "string"},
+                    "space_key": {"type": "string"},
+                },
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "confluence_create_page",
+            "description": "Create a Confluence page",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "content": {"type": "string"},
+                    "space_key": {"type": "string"},
+                    "parent_id": {"type": "string"},
+                    "labels": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["title", "content", "space_key"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "confluence_update_page",
+            "description": "Update a Confluence page",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "page_id": {"type": "string"},
+                    "updates": {"type": "object"},
+                },
+                "required": ["page_id", "updates"],
+                "additionalProperties": False,
+            },
+        },
+    },
+]
+
+# Canonical tool schemas and the fingerprint used in response cache keys
+_TOOLS_SCHEMA, _TOOLS_HASH = freeze_tools(_TOOL_DEFINITIONS)
+
+# Agent serving each structured command type; other types go through the LLM
+_COMMAND_AGENTS: Dict[CommandType, str] = {
+    CommandType.JIRA_ISSUE: "jira",
+    CommandType.JIRA_PROJECT: "jira",
+    CommandType.JIRA_SPRINT: "jira",
+    CommandType.CONFLUENCE_PAGE: "confluence",
+    CommandType.CONFLUENCE_SPACE: "confluence",
+}
+
+# Arguments each tool's agent method accepts; anything else the LLM sends is dropped
+_TOOL_PARAMS: Dict[str, FrozenSet[str]] = {
+    tool["function"]["name"]: frozenset(tool["function"]["parameters"]["properties"])
+    for tool in _TOOL_DEFINITIONS
+}
+
 
 class GoogleAgentDevelopmentKitCoordinator:
     """LiteLLM-powered coordinator that mirrors Google Agent Development Kit patterns."""
@@ -36,118 +166,24 @@ class GoogleAgentDevelopmentKitCoordinator:
         self.jira_agent = JiraAgent(os.getenv("JIRA_MCP_URL", "https://athonprompt.atlassian.net/rest/api/3"))
         self.confluence_agent = ConfluenceAgent(os.getenv("CONFLUENCE_MCP_URL", "https://athonprompt.atlassian.net/wiki/rest/api"))
 
-        self.tools: List[Dict[str, Any]] = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "jira_get_issues",
-                    "description": "Retrieve Jira issues with optional filters",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "project": {"type": "string"},
-                            "status": {"type": "string"},
-                            "assignee": {"type": "string"},
-                            "issue_type": {"type": "string"},
-                            "max_results": {"type": "integer", "default": 50},
-                        },
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "jira_create_issue",
-                    "description": "Create a new Jira issue",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "project": {"type": "string"},
-                            "summary": {"type": "string"},
-                            "description": {"type": "string"},
-                            "issue_type": {"type": "string", "default": "Task"},
-                            "priority": {"type": "string", "default": "Medium"},
-                            "assignee": {"type": "string"},
-                            "labels": {"type": "array", "items": {"type": "string"}},
-                        },
-                        "required": ["project", "summary"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "jira_update_issue",
-                    "description": "Update an existing Jira issue by key",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {"type": "string"},
-                            "updates": {"type": "object"},
-                        },
-                        "required": ["issue_key", "updates"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "confluence_get_page",
-                    "description": "Retrieve a Confluence page by id/title/space",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "page_id": {"type": "string"},
-                            "title": {"type": "string"},
-                            "space_key": {"type": "string"},
-                        },
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "confluence_create_page",
-                    "description": "Create a Confluence page",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string"},
-                            "content": {"type": "string"},
-                            "space_key": {"type": "string"},
-                            "parent_id": {"type": "string"},
-                            "labels": {"type": "array", "items": {"type": "string"}},
-                        },
-                        "required": ["title", "content", "space_key"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "confluence_update_page",
-                    "description": "Update a Confluence page",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "page_id": {"type": "string"},
-                            "updates": {"type": "object"},
-                        },
-                        "required": ["page_id", "updates"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-        ]
+        self.tools = _TOOLS_SCHEMA
+
+        # Tool name -> agent method; structured commands resolve "<agent>_<action>" here too
+        self._tool_dispatch: Dict[str, Callable[..., Awaitable[Any]]] = {
+            "jira_get_issues": self.jira_agent.get_issues,
+            "jira_create_issue": self.jira_agent.create_issue,
+            "jira_update_issue": self.jira_agent.update_issue,
+            "confluence_get_page": self.confluence_agent.get_page,
+            "confluence_create_page": self.confluence_agent.create_page,
+            "confluence_update_page": self.confluence_agent.update_page,
+        }
 
     async def initialize(self) -> bool:
-        jira_ok = await self.jira_agent.initialize()
-        confluence_ok = await self.confluence_agent.initialize()
+        # Independent connection probes; overlap them
+        jira_ok, confluence_ok = await asyncio.gather(
+            self.jira_agent.initialize(),
+            self.confluence_agent.initialize(),
+        )
         
         # Initialize LLM agent matching requested style
         self.llm_agent = LlmAgent(
@@ -156,6 +192,7 @@ class GoogleAgentDevelopmentKitCoordinator:
                 model=self.model,
                 api_base=os.getenv("LITELLM_API_BASE"),
                 api_key=os.getenv("LITELLM_API_KEY"),
+                temperature=temperature_from_env(),
             ),
             system_prompt=self.system_prompt,
         )
@@ -168,63 +205,70 @@ class GoogleAgentDevelopmentKitCoordinator:
         return True
 
     async def shutdown(self) -> None:
-        await self.jira_agent.shutdown()
-        await self.confluence_agent.shutdown()
+        # Close both agents even if one of them fails
+        results = await asyncio.gather(
+            self.jira_agent.shutdown(),
+            self.confluence_agent.shutdown(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️ Agent shutdown failed: {result}")
 
     async def chat_execute(self, user_message: str) -> List[AgentResponse]:
         logger.info(f"🤖 AI Processing request: {user_message[:100]}...")
         
-        resp = self.llm_agent.chat(user_message=user_message, tools=self.tools)
+        resp = await self.llm_agent.achat(user_message=user_message, tools=self.tools, tools_key=_TOOLS_HASH)
         msg = resp.choices[0].message  # type: ignore[index]
 
         tool_calls = getattr(msg, "tool_calls", None)
         if tool_calls:
             logger.info(f"🔧 AI selected {len(tool_calls)} tool(s) to execute")
-            results: List[AgentResponse] = []
-            for tool_call in tool_calls:
-                name = tool_call.function.name  # type: ignore[attr-defined]
-                args = tool_call.function.arguments  # type: ignore[attr-defined]
-                import json
-
-                try:
-                    parsed_args = json.loads(args) if isinstance(args, str) else (args or {})
-                    logger.info(f"🛠️  Executing tool: {name}")
-                    data = await self._invoke_tool(name, parsed_args)
-                    # Check if tool returned an error
-                    if isinstance(data, dict) and data.get("status") in ["unavailable", "error"]:
-                        logger.error(f"❌ Tool failed: {name} - {data.get('error')}")
-                        results.append(AgentResponse(agent_name=name, success=False, data=data, error_message=data.get("error")))
-                    else:
-                        logger.info(f"✅ Tool completed successfully: {name}")
-                        # Log summary of what was created/updated
-                        self._log_tool_result_summary(name, data)
-                        results.append(AgentResponse(agent_name=name, success=True, data=data))
-                except Exception as e:
-                    logger.error(f"❌ Tool exception: {name} - {str(e)}")
-                    results.append(AgentResponse(agent_name=name, success=False, data=None, error_message=str(e)))
-            return results
+            # Tool calls are independent Jira/Confluence requests; run them concurrently
+            return list(await asyncio.gather(*(self._run_one_tool(tool_call) for tool_call in tool_calls)))
 
         logger.info("💬 AI provided text response (no tools used)")
         return [AgentResponse(agent_name="llm", success=True, data=getattr(msg, "content", ""))]
 
+    async def _run_one_tool(self, tool_call: Any) -> AgentResponse:
+        """Execute a single LLM tool call and wrap the outcome in an AgentResponse."""
+        name = tool_call.function.name  # type: ignore[attr-defined]
+        args = tool_call.function.arguments  # type: ignore[attr-defined]
+
+        try:
+            parsed_args = orjson.loads(args) if isinstance(args, str) else (args or {})
+            logger.info(f"🛠️  Executing tool: {name}")
+            data = await self._invoke_tool(name, parsed_args)
+            # Check if tool returned an error
+            if isinstance(data, dict) and data.get("status") in ["unavailable", "error"]:
+                logger.error(f"❌ Tool failed: {name} - {data.get('error')}")
+                return AgentResponse(agent_name=name, success=False, data=data, error_message=data.get("error"))
+            logger.info(f"✅ Tool completed successfully: {name}")
+            # Log summary of what was created/updated
+            self._log_tool_result_summary(name, data)
+            return AgentResponse(agent_name=name, success=True, data=data)
+        except Exception as e:
+            logger.error(f"❌ Tool exception: {name} - {str(e)}")
+            return AgentResponse(agent_name=name, success=False, data=None, error_message=str(e))
+
     async def execute_command(self, command: Command) -> List[AgentResponse]:
-        if command.command_type in {CommandType.JIRA_ISSUE, CommandType.JIRA_PROJECT, CommandType.JIRA_SPRINT}:
-            return [
-                AgentResponse(
-                    agent_name="jira",
-                    success=True,
-                    data=await self._execute_jira(command.action, command.parameters),
-                )
-            ]
-        if command.command_type in {CommandType.CONFLUENCE_PAGE, CommandType.CONFLUENCE_SPACE}:
-            return [
-                AgentResponse(
-                    agent_name="confluence",
-                    success=True,
-                    data=await self._execute_confluence(command.action, command.parameters),
-                )
-            ]
-        return await self.chat_execute(f"Execute command: {command}")
+        """Run a structured command directly against the agents, skipping the LLM."""
+        agent_name = _COMMAND_AGENTS.get(command.command_type)
+        if agent_name is None:
+            return await self.chat_execute(f"Execute command: {command}")
+
+        available = self.jira_available if agent_name == "jira" else self.confluence_available
+        if not available:
+            return [AgentResponse(agent_name=agent_name, success=False, data=None, error_message=f"{agent_name.capitalize()} MCP server not available")]
+        try:
+            execute = self._tool_dispatch.get(f"{agent_name}_{command.action}")
+            if execute is None:
+                raise ValueError(f"Unknown {agent_name.capitalize()} action: {command.action}")
+            data = await execute(**command.parameters)
+        except Exception as e:
+            logger.error(f"❌ Command failed: {agent_name}.{command.action} - {str(e)}")
+            return [AgentResponse(agent_name=agent_name, success=False, data=None, error_message=str(e))]
+        return [AgentResponse(agent_name=agent_name, success=True, data=data)]
 
     def _log_tool_result_summary(self, tool_name: str, data: Any) -> None:
         """Log a high-level summary of what was created/updated."""
@@ -246,56 +290,14 @@ class GoogleAgentDevelopmentKitCoordinator:
 
     async def _invoke_tool(self, name: str, args: Dict[str, Any]) -> Any:
         try:
-            if name.startswith("jira_"):
-                if not self.jira_available:
-                    return {"error": "Jira MCP server not available", "status": "unavailable"}
-                if name == "jira_get_issues":
-                    # Filter valid parameters for get_issues
-                    valid_params = {k: v for k, v in args.items() if k in ["project", "status", "assignee", "issue_type", "max_results"]}
-                    return await self.jira_agent.get_issues(**valid_params)
-                if name == "jira_create_issue":
-                    # Filter valid parameters for create_issue
-                    valid_params = {k: v for k, v in args.items() if k in ["project", "summary", "description", "issue_type", "priority", "assignee", "labels"]}
-                    return await self.jira_agent.create_issue(**valid_params)
-                if name == "jira_update_issue":
-                    # Filter valid parameters for update_issue
-                    valid_params = {k: v for k, v in args.items() if k in ["issue_key", "updates"]}
-                    return await self.jira_agent.update_issue(**valid_params)
-            elif name.startswith("confluence_"):
-                if not self.confluence_available:
-                    return {"error": "Confluence MCP server not available", "status": "unavailable"}
-                if name == "confluence_get_page":
-                    # Filter valid parameters for get_page
-                    valid_params = {k: v for k, v in args.items() if k in ["page_id", "title", "space_key"]}
-                    return await self.confluence_agent.get_page(**valid_params)
-                if name == "confluence_create_page":
-                    # Filter valid parameters for create_page
-                    valid_params = {k: v for k, v in args.items() if k in ["title", "content", "space_key", "parent_id", "labels"]}
-                    return await self.confluence_agent.create_page(**valid_params)
-                if name == "confluence_update_page":
-                    # Filter valid parameters for update_page
-                    valid_params = {k: v for k, v in args.items() if k in ["page_id", "updates"]}
-                    return await self.confluence_agent.update_page(**valid_params)
-            raise ValueError(f"Unknown tool: {name}")
+            tool = self._tool_dispatch.get(name)
+            if tool is None:
+                raise ValueError(f"Unknown tool: {name}")
+            if name.startswith("jira_") and not self.jira_available:
+                return {"error": "Jira MCP server not available", "status": "unavailable"}
+            if name.startswith("confluence_") and not self.confluence_available:
+                return {"error": "Confluence MCP server not available", "status": "unavailable"}
+            valid_params = {k: v for k, v in args.items() if k in _TOOL_PARAMS[name]}
+            return await tool(**valid_params)
         except Exception as e:
             return {"error": str(e), "status": "error"}
-
-    async def _execute_jira(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == "get_issues":
-            return await self.jira_agent.get_issues(**params)
-        if action == "create_issue":
-            return await self.jira_agent.create_issue(**params)
-        if action == "update_issue":
-            return await self.jira_agent.update_issue(**params)
-        raise ValueError(f"Unknown Jira action: {action}")
-
-    async def _execute_confluence(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == "get_page":
-            return await self.confluence_agent.get_page(**params)
-        if action == "create_page":
-            return await self.confluence_agent.create_page(**params)
-        if action == "update_page":
-            return await self.confluence_agent.update_page(**params)
-        raise ValueError(f"Unknown Confluence action: {action}")
-
-
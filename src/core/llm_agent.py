@@ -13,11 +13,85 @@ LlmAgent(
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
+import random
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from litellm import completion
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# litellm is imported on first use (see _litellm); importing it pulls in
+# every provider integration and costs hundreds of milliseconds
+_LITELLM: Any = None
+# Provider errors that are worth retrying: rate limits and transient faults
+_RETRYABLE_ERRORS: Tuple[type, ...] = ()
+_RETRY_INITIAL_DELAY = 0.5
+_RETRY_MAX_DELAY = 8.0
+
+
+def _litellm() -> Any:
+    """Return the litellm module, importing it on the first call."""
+    global _LITELLM, _RETRYABLE_ERRORS
+    if _LITELLM is None:
+        import litellm
+
+        _RETRYABLE_ERRORS = (
+            litellm.APIConnectionError,
+            litellm.InternalServerError,
+            litellm.RateLimitError,
+            litellm.ServiceUnavailableError,
+            litellm.Timeout,
+        )
+        _LITELLM = litellm
+    return _LITELLM
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for a 0-based retry attempt."""
+    return random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_INITIAL_DELAY * 2 ** attempt))
+
+
+def freeze_tools(definitions: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], str]:
+    """Return tool schemas in canonical (sorted-key) form and their fingerprint.
+
+    The canonical payload is byte-identical across processes, which keeps
+    provider prompt-prefix cache hits; the hash is passed as tools_key.
+    """
+    serialized = json.dumps(definitions, sort_keys=True, separators=(",", ":"))
+    return json.loads(serialized), hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def temperature_from_env(default: Optional[float] = None) -> Optional[float]:
+    """LITELLM_TEMPERATURE as a float; unset or empty falls back to default."""
+    value = os.getenv("LITELLM_TEMPERATURE")
+    return float(value) if value else default
+
+
+def _is_cacheable(response: Any) -> bool:
+    """True unless the response selects tools, which must run on every turn."""
+    choices = getattr(response, "choices", None)
+    if not choices:
+        return True
+    return not getattr(choices[0].message, "tool_calls", None)
+
+
+class LLMResponseCache(TTLCache):
+    """Exact-match, in-memory cache of LLM responses with a TTL and LRU eviction.
+
+    LiteLlm only stores plain replies to deterministic (temperature 0)
+    requests; a reply that selects tools is never stored, since replaying it
+    would re-run a write such as "create issue" without consulting the model.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 1800.0) -> None:
+        super().__init__(maxsize, ttl)
 
 
 @dataclass
@@ -25,8 +99,99 @@ class LiteLlm:
     model: str
     api_base: Optional[str] = None
     api_key: Optional[str] = None
+    response_cache: Optional[LLMResponseCache] = None
+    max_attempts: int = 4
+    # None leaves sampling to the provider; only temperature 0 is cached
+    temperature: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        # Sampled replies are never reused, so only deterministic models get a cache
+        if self.response_cache is None and self.temperature == 0:
+            self.response_cache = LLMResponseCache()
 
-    def complete(self, messages: List[Dict[str, str]], tools: Optional[List[Dict[str, Any]]] = None, tool_choice: str = "auto"):
+    def complete(self, messages: List[Dict[str, str]], tools: Optional[List[Dict[str, Any]]] = None, tool_choice: str = "auto", tools_key: Optional[str] = None):
+        params = self._params(messages, tools, tool_choice)
+        key = self._cache_key(messages, tools, tool_choice, tools_key)
+        if key is None:
+            return self._completion(params)
+        response = self.response_cache.get(key)
+        if response is None:
+            response = self._completion(params)
+            if _is_cacheable(response):
+                self.response_cache.set(key, response)
+        return response
+
+    async def acomplete(self, messages: List[Dict[str, str]], tools: Optional[List[Dict[str, Any]]] = None, tool_choice: str = "auto", tools_key: Optional[str] = None):
+        """Non-blocking variant of complete() for use inside the event loop.
+
+        tools_key, when given, is a precomputed fingerprint of tools used in
+        the response cache key instead of hashing the schemas on every call.
+        """
+        params = self._params(messages, tools, tool_choice)
+        key = self._cache_key(messages, tools, tool_choice, tools_key)
+        if key is None:
+            return await self._acompletion(params)
+        return await self.response_cache.get_or_fetch(key, lambda: self._acompletion(params), _is_cacheable)
+
+    async def astream(self, messages: List[Dict[str, str]], tools: Optional[List[Dict[str, Any]]] = None, tool_choice: str = "auto"):
+        """Start a streaming completion and return its async chunk iterator.
+
+        Streams bypass the response cache: a partially consumed stream
+        cannot be replayed to another caller.
+        """
+        params = self._params(messages, tools, tool_choice)
+        params["stream"] = True
+        return await self._acompletion(params)
+
+    async def awarmup(self, messages: List[Dict[str, Any]]) -> None:
+        """Send a one-token completion, uncached and without retries.
+
+        Pays the litellm import, DNS/TLS setup and provider cold start before
+        the first real request.
+        """
+        params = self._params(messages, None, "auto")
+        params["max_tokens"] = 1
+        await _litellm().acompletion(**params)
+
+    def _completion(self, params: Dict[str, Any]):
+        litellm = _litellm()
+        for attempt in range(self.max_attempts):
+            try:
+                return litellm.completion(**params)
+            except _RETRYABLE_ERRORS as exc:
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"LLM call failed ({exc.__class__.__name__}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+
+    async def _acompletion(self, params: Dict[str, Any]):
+        litellm = _litellm()
+        for attempt in range(self.max_attempts):
+            try:
+                return await litellm.acompletion(**params)
+            except _RETRYABLE_ERRORS as exc:
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"LLM call failed ({exc.__class__.__name__}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    def _cache_key(self, messages: List[Dict[str, str]], tools: Optional[List[Dict[str, Any]]], tool_choice: str, tools_key: Optional[str]) -> Optional[str]:
+        # Forced tool choices are one-off requests, and sampled replies are not
+        # reproducible; only cache deterministic requests in the default mode
+        if self.response_cache is None or tool_choice != "auto" or self.temperature != 0:
+            return None
+        return LLMResponseCache.make_key({
+            "model": self.model,
+            "api_base": self.api_base,
+            "messages": messages,
+            "tools": tools if tools_key is None else tools_key,
+            "tool_choice": tool_choice,
+            "temperature": self.temperature,
+        })
+
+    def _params(self, messages: List[Dict[str, str]], tools: Optional[List[Dict[str, Any]]], tool_choice: str) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "model": self.model,
             "messages": messages,
@@ -34,13 +199,19 @@ class LiteLlm:
         if tools is not None:
             params["tools"] = tools
             params["tool_choice"] = tool_choice
+        if self.temperature is not None:
+            params["temperature"] = self.temperature
         if self.api_base:
             params["api_base"] = self.api_base
         # Allow LITELLM_API_KEY or OPENAI_API_KEY env fallback
         key = self.api_key or os.getenv("LITELLM_API_KEY") or os.getenv("OPENAI_API_KEY")
         if key:
             params["api_key"] = key
-        return completion(**params)
+        return params
+
+
+# Providers that honour Anthropic-style cache_control breakpoints
+_PROMPT_CACHING_PREFIXES = ("anthropic/", "bedrock/", "claude-")
 
 
 class LlmAgent:
@@ -48,12 +219,39 @@ class LlmAgent:
         self.name = name
         self.model = model
         self.system_prompt = system_prompt or "You are a helpful orchestration agent. Prefer calling tools."
+        # Built once: the system message is identical on every turn. The prompt
+        # prefix is tools -> system, so one breakpoint here caches both.
+        self._system_message: Dict[str, Any] = {"role": "system", "content": self.system_prompt}
+        if model.model.startswith(_PROMPT_CACHING_PREFIXES):
+            self._system_message["content"] = [
+                {"type": "text", "text": self.system_prompt, "cache_control": {"type": "ephemeral"}},
+            ]
+
+    def chat(self, user_message: str, tools: Optional[List[Dict[str, Any]]] = None, tools_key: Optional[str] = None):
+        resp = self.model.complete(messages=self._messages(user_message), tools=tools, tool_choice="auto", tools_key=tools_key)
+        self._log_cache_usage(resp)
+        return resp
 
-    def chat(self, user_message: str, tools: Optional[List[Dict[str, Any]]] = None):
-        messages: List[Dict[str, str]] = [
-            {"role": "system", "content": self.system_prompt},
+    async def achat(self, user_message: str, tools: Optional[List[Dict[str, Any]]] = None, tools_key: Optional[str] = None):
+        resp = await self.model.acomplete(messages=self._messages(user_message), tools=tools, tool_choice="auto", tools_key=tools_key)
+        self._log_cache_usage(resp)
+        return resp
+
+    async def achat_stream(self, user_message: str, tools: Optional[List[Dict[str, Any]]] = None) -> AsyncIterator[Any]:
+        stream = await self.model.astream(messages=self._messages(user_message), tools=tools, tool_choice="auto")
+        async for chunk in stream:
+            yield chunk
+
+    async def awarmup(self) -> None:
+        await self.model.awarmup(self._messages("ping"))
+
+    def _messages(self, user_message: str) -> List[Dict[str, Any]]:
+        return [
+            self._system_message,
             {"role": "user", "content": user_message},
         ]
-        return self.model.complete(messages=messages, tools=tools, tool_choice="auto")
-
 
+    def _log_cache_usage(self, resp: Any) -> None:
+        cache_read = getattr(getattr(resp, "usage", None), "cache_read_input_tokens", None)
+        if cache_read is not None:
+            logger.debug(f"{self.name}: {cache_read} prompt token(s) read from provider cache")
@@ -1,16 +1,197 @@
 """Scrum Master coordinator for Google Agent Development Kit web interface."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from .llm_agent import LlmAgent, LiteLlm
+import orjson
+
+from .cache import TTLCache
+from .llm_agent import LLMResponseCache, LlmAgent, LiteLlm, freeze_tools, temperature_from_env
 from .types import AgentResponse
 from ..agents.scrum_master_agent import ScrumMasterAgent
 
 logger = logging.getLogger(__name__)
 
+# End of a sentence in streamed advisory text; chunks are flushed after it
+_SENTENCE_BOUNDARY = re.compile(r"[.!?]\s+")
+# Non-negative percentage such as "42", "42.5%" or " 42 % "
+_PCT_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*%?\s*$")
+
+# Read-only actions whose results are reused for a few seconds (TTL in seconds)
+_CACHEABLE_ACTION_TTLS: Dict[str, float] = {"conduct_standup": 30.0, "generate_burndown": 60.0}
+# TTL once the sprint is past its end date or fully burned down. Such results
+# still move when issues are transitioned in Jira (here or elsewhere), but
+# rarely, so a few minutes of staleness is acceptable; write actions made
+# through this coordinator clear the cache immediately
+_SETTLED_SPRINT_TTL = 300.0
+# Actions that change sprint state and invalidate cached reads
+_SPRINT_WRITE_ACTIONS = frozenset({"start_sprint", "plan_sprint", "assign_tasks"})
+# Upper bound on the startup LLM ping, so a slow provider cannot stall startup
+_WARMUP_TIMEOUT = 10.0
+
+# Tools available to the Scrum Master AI
+_TOOL_DEFINITIONS: List[Dict[str, Any]] = [
+    # Sprint Management Tools
+    {
+        "type": "function",
+        "function": {
+            "name": "start_sprint",
+            "description": "Start a new sprint with planning and documentation",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "sprint_name": {"type": "string", "description": "Name of the sprint (e.g., 'Sprint 1', 'Q1 Sprint 3')"},
+                    "duration_weeks": {"type": "integer", "default": 2, "description": "Sprint duration in weeks"},
+                    "sprint_goal": {"type": "string", "description": "Main goal/objective for this sprint"},
+                    "jira_project_key": {"type": "string", "description": "Jira project key (user must specify)"},
+                    "confluence_space_key": {"type": "string", "description": "Confluence space key for documentation (user must specify)"},
+                },
+                "required": ["sprint_name", "sprint_goal", "jira_project_key", "confluence_space_key"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "plan_sprint",
+            "description": "Conduct sprint planning session with requirements and team",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "requirements": {
+                        "type": "array",
+                        "description": "List of requirements/user stories for the sprint",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string"},
+                                "description": {"type": "string"},
+                                "priority": {"type": "string", "enum": ["Low", "Medium", "High", "Critical"]},
+                                "estimated_hours": {"type": "integer"},
+                                "required_skills": {"type": "array", "items": {"type": "string"}},
+                            }
+                        }
+                    },
+                    "team_members": {
+                        "type": "array",
+                        "description": "Team members available for the sprint",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "username": {"type": "string"},
+                                "display_name": {"type": "string"},
+                                "skills": {"type": "array", "items": {"type": "string"}},
+                                "capacity": {"type": "number", "description": "Work capacity (0.0-1.0)"},
+                            }
+                        }
+                    },
+                    "sprint_capacity": {"type": "integer", "default": 40, "description": "Total sprint capacity in story points"},
+                    "jira_project_key": {"type": "string", "description": "Jira project key for creating issues"},
+                },
+                "required": ["requirements", "team_members", "jira_project_key"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "conduct_standup",
+            "description": "Conduct daily standup meeting and provide status update",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "jira_project_key": {"type": "string", "description": "Jira project key to check issues"},
+                },
+                "required": ["jira_project_key"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "assign_tasks",
+            "description": "Intelligently assign tasks to team members based on skills and workload",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "requirements": {
+                        "type": "array",
+                        "description": "Tasks/requirements to assign",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string"},
+                                "description": {"type": "string"},
+                                "priority": {"type": "string"},
+                                "issue_type": {"type": "string", "default": "Task"},
+                                "estimated_hours": {"type": "integer"},
+                                "required_skills": {"type": "array", "items": {"type": "string"}},
+                            }
+                        }
+                    },
+                    "team_members": {
+                        "type": "array",
+                        "description": "Available team members",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "username": {"type": "string"},
+                                "display_name": {"type": "string"},
+                                "skills": {"type": "array", "items": {"type": "string"}},
+                                "capacity": {"type": "number"},
+                            }
+                        }
+                    },
+                    "jira_project_key": {"type": "string", "description": "Jira project key for creating issues"},
+                },
+                "required": ["requirements", "team_members", "jira_project_key"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "generate_burndown",
+            "description": "Generate burndown chart data for current sprint",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "jira_project_key": {"type": "string", "description": "Jira project key for burndown analysis"},
+                },
+                "required": ["jira_project_key"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "sprint_report",
+            "description": "Generate comprehensive sprint status report",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "jira_project_key": {"type": "string", "description": "Jira project key for sprint report"},
+                    "include_team_metrics": {"type": "boolean", "default": True},
+                },
+                "required": ["jira_project_key"],
+                "additionalProperties": False,
+            },
+        },
+    },
+]
+
+# Canonical tool schemas and the fingerprint used in response cache keys
+_TOOLS_SCHEMA, _TOOLS_HASH = freeze_tools(_TOOL_DEFINITIONS)
+
 
 class ScrumMasterCoordinator:
     """
@@ -22,6 +203,7 @@ class ScrumMasterCoordinator:
         self,
         model: Optional[str] = None,
         system_prompt: Optional[str] = None,
+        enable_parallel_tool_execution: bool = True,
     ) -> None:
         self.model = model or os.getenv("LITELLM_MODEL", "openai/gpt-4o-mini")
         self.system_prompt = system_prompt or (
@@ -43,164 +225,27 @@ class ScrumMasterCoordinator:
             "supportive, and focused on continuous improvement."
         )
 
+        # Run multiple tool calls from one model turn concurrently
+        self.enable_parallel_tool_execution = enable_parallel_tool_execution
+
         # Initialize the Scrum Master agent
         self.scrum_master = ScrumMasterAgent()
+        # Scrum Master action name -> agent method
+        self._action_dispatch: Dict[str, Callable[..., Awaitable[Any]]] = {
+            "start_sprint": self.scrum_master.start_sprint,
+            "plan_sprint": self.scrum_master.plan_sprint,
+            "conduct_standup": self.scrum_master.conduct_standup,
+            "assign_tasks": self.scrum_master.assign_tasks,
+            "generate_burndown": self.scrum_master.generate_burndown,
+        }
+        # Results of read-only actions, with a TTL per action (see _action_ttl)
+        self._action_cache = TTLCache(maxsize=512, ttl=60.0)
+        # Write actions left running after a stream consumer stopped early;
+        # referenced here so they are not garbage-collected mid-flight
+        self._detached_writes: Set["asyncio.Future[AgentResponse]"] = set()
         
         # Define tools available to the AI
-        self.tools: List[Dict[str, Any]] = [
-            # Sprint Management Tools
-            {
-                "type": "function",
-                "function": {
-                    "name": "start_sprint",
-                    "description": "Start a new sprint with planning and documentation",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "sprint_name": {"type": "string", "description": "Name of the sprint (e.g., 'Sprint 1', 'Q1 Sprint 3')"},
-                            "duration_weeks": {"type": "integer", "default": 2, "description": "Sprint duration in weeks"},
-                            "sprint_goal": {"type": "string", "description": "Main goal/objective for this sprint"},
-                            "jira_project_key": {"type": "string", "description": "Jira project key (user must specify)"},
-                            "confluence_space_key": {"type": "string", "description": "Confluence space key for documentation (user must specify)"},
-                        },
-                        "required": ["sprint_name", "sprint_goal", "jira_project_key", "confluence_space_key"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "plan_sprint",
-                    "description": "Conduct sprint planning session with requirements and team",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "requirements": {
-                                "type": "array",
-                                "description": "List of requirements/user stories for the sprint",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "title": {"type": "string"},
-                                        "description": {"type": "string"},
-                                        "priority": {"type": "string", "enum": ["Low", "Medium", "High", "Critical"]},
-                                        "estimated_hours": {"type": "integer"},
-                                        "required_skills": {"type": "array", "items": {"type": "string"}},
-                                    }
-                                }
-                            },
-                            "team_members": {
-                                "type": "array",
-                                "description": "Team members available for the sprint",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "username": {"type": "string"},
-                                        "display_name": {"type": "string"},
-                                        "skills": {"type": "array", "items": {"type": "string"}},
-                                        "capacity": {"type": "number", "description": "Work capacity (0.0-1.0)"},
-                                    }
-                                }
-                            },
-                            "sprint_capacity": {"type": "integer", "default": 40, "description": "Total sprint capacity in story points"},
-                            "jira_project_key": {"type": "string", "description": "Jira project key for creating issues"},
-                        },
-                        "required": ["requirements", "team_members", "jira_project_key"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "conduct_standup",
-                    "description": "Conduct daily standup meeting and provide status update",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "jira_project_key": {"type": "string", "description": "Jira project key to check issues"},
-                        },
-                        "required": ["jira_project_key"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "assign_tasks",
-                    "description": "Intelligently assign tasks to team members based on skills and workload",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "requirements": {
-                                "type": "array",
-                                "description": "Tasks/requirements to assign",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "title": {"type": "string"},
-                                        "description": {"type": "string"},
-                                        "priority": {"type": "string"},
-                                        "issue_type": {"type": "string", "default": "Task"},
-                                        "estimated_hours": {"type": "integer"},
-                                        "required_skills": {"type": "array", "items": {"type": "string"}},
-                                    }
-                                }
-                            },
-                            "team_members": {
-                                "type": "array",
-                                "description": "Available team members",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "username": {"type": "string"},
-                                        "display_name": {"type": "string"},
-                                        "skills": {"type": "array", "items": {"type": "string"}},
-                                        "capacity": {"type": "number"},
-                                    }
-                                }
-                            },
-                            "jira_project_key": {"type": "string", "description": "Jira project key for creating issues"},
-                        },
-                        "required": ["requirements", "team_members", "jira_project_key"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "generate_burndown",
-                    "description": "Generate burndown chart data for current sprint",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "jira_project_key": {"type": "string", "description": "Jira project key for burndown analysis"},
-                        },
-                        "required": ["jira_project_key"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "sprint_report",
-                    "description": "Generate comprehensive sprint status report",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "jira_project_key": {"type": "string", "description": "Jira project key for sprint report"},
-                            "include_team_metrics": {"type": "boolean", "default": True},
-                        },
-                        "required": ["jira_project_key"],
-                        "additionalProperties": False,
-                    },
-                },
-            },
-        ]
+        self.tools = _TOOLS_SCHEMA
 
     async def initialize(self) -> bool:
         """Initialize the Scrum Master coordinator."""
@@ -214,17 +259,43 @@ class ScrumMasterCoordinator:
                     model=self.model,
                     api_base=os.getenv("LITELLM_API_BASE"),
                     api_key=os.getenv("LITELLM_API_KEY"),
+                    # Deterministic by default, so repeated prompts hit the response cache
+                    temperature=temperature_from_env(0.0),
+                    # Standup/burndown questions repeat within minutes, not hours;
+                    # only advisory (no tool call) replies are stored
+                    response_cache=LLMResponseCache(maxsize=1024, ttl=300.0),
                 ),
                 system_prompt=self.system_prompt,
             )
             logger.info("✅ Scrum Master Coordinator initialized successfully")
+            if os.getenv("LITELLM_WARMUP", "false").lower() == "true":
+                await self.warmup()
         else:
             logger.warning("⚠️ Scrum Master Coordinator initialized with limited functionality")
         
         return scrum_master_ok
 
+    async def warmup(self) -> None:
+        """Best-effort LLM ping so the first user message does not pay cold-start costs.
+
+        MCP sessions are already warm: initialize() opened them with a health check.
+        """
+        llm_agent = getattr(self, "llm_agent", None)
+        if llm_agent is None:
+            return
+        try:
+            await asyncio.wait_for(llm_agent.awarmup(), _WARMUP_TIMEOUT)
+            logger.info("🔥 Scrum Master LLM warmed up")
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ LLM warmup timed out after {_WARMUP_TIMEOUT:.0f}s")
+        except Exception as e:
+            logger.warning(f"⚠️ LLM warmup failed: {str(e)}")
+
     async def shutdown(self) -> None:
         """Shutdown the coordinator."""
+        if self._detached_writes:
+            # Let writes abandoned by stream consumers finish before closing sessions
+            await asyncio.gather(*self._detached_writes, return_exceptions=True)
         await self.scrum_master.shutdown()
 
     async def chat_execute(self, user_message: str) -> List[AgentResponse]:
@@ -232,49 +303,15 @@ class ScrumMasterCoordinator:
         logger.info(f"🏃‍♂️ Scrum Master AI processing: {user_message[:100]}...")
         
         try:
-            resp = self.llm_agent.chat(user_message=user_message, tools=self.tools)
+            resp = await self.llm_agent.achat(user_message=user_message, tools=self.tools, tools_key=_TOOLS_HASH)
             msg = resp.choices[0].message  # type: ignore[index]
 
             tool_calls = getattr(msg, "tool_calls", None)
             if tool_calls:
                 logger.info(f"🔧 Scrum Master AI selected {len(tool_calls)} action(s)")
-                results: List[AgentResponse] = []
-                
-                for tool_call in tool_calls:
-                    name = tool_call.function.name  # type: ignore[attr-defined]
-                    args = tool_call.function.arguments  # type: ignore[attr-defined]
-                    import json
-
-                    try:
-                        parsed_args = json.loads(args) if isinstance(args, str) else (args or {})
-                        logger.info(f"🛠️ Executing Scrum Master action: {name}")
-                        
-                        data = await self._invoke_scrum_action(name, parsed_args)
-                        
-                        if isinstance(data, dict) and data.get("error"):
-                            results.append(AgentResponse(
-                                agent_name=f"scrum_master_{name}", 
-                                success=False, 
-                                data=data, 
-                                error_message=data.get("error")
-                            ))
-                        else:
-                            logger.info(f"✅ Scrum Master action completed: {name}")
-                            results.append(AgentResponse(
-                                agent_name=f"scrum_master_{name}", 
-                                success=True, 
-                                data=data
-                            ))
-                    except Exception as e:
-                        logger.error(f"❌ Scrum Master action failed: {name} - {str(e)}")
-                        results.append(AgentResponse(
-                            agent_name=f"scrum_master_{name}", 
-                            success=False, 
-                            data=None, 
-                            error_message=str(e)
-                        ))
-                
-                return results
+                return await self._run_scrum_actions(
+                    [(tool_call.function.name, tool_call.function.arguments) for tool_call in tool_calls]  # type: ignore[attr-defined]
+                )
 
             # If no tools called, return AI response
             logger.info("💬 Scrum Master provided advisory response")
@@ -293,23 +330,137 @@ class ScrumMasterCoordinator:
                 error_message=str(e)
             )]
 
+    async def chat_execute_stream(self, user_message: str) -> AsyncIterator[AgentResponse]:
+        """Streaming variant of chat_execute.
+
+        Advisory text is yielded a sentence at a time while the model is still
+        generating. Tool calls are assembled from the stream deltas and run once
+        the stream ends; each result is yielded as soon as its action finishes.
+        """
+        logger.info(f"🏃‍♂️ Scrum Master AI streaming: {user_message[:100]}...")
+        
+        try:
+            buffer = ""
+            # Tool call fragments by stream index: [name, arguments]
+            pending_calls: Dict[int, List[str]] = {}
+            async for chunk in self.llm_agent.achat_stream(user_message=user_message, tools=self.tools):
+                delta = chunk.choices[0].delta  # type: ignore[index]
+                
+                content = getattr(delta, "content", None)
+                if content:
+                    buffer += content
+                    boundary = None
+                    for boundary in _SENTENCE_BOUNDARY.finditer(buffer):
+                        pass
+                    if boundary:
+                        yield AgentResponse(agent_name="scrum_master_advisor", success=True, data=buffer[:boundary.end()])
+                        buffer = buffer[boundary.end():]
+                
+                for tool_call in getattr(delta, "tool_calls", None) or ():
+                    fragments = pending_calls.setdefault(tool_call.index, ["", ""])
+                    if tool_call.function.name:
+                        fragments[0] += tool_call.function.name
+                    if tool_call.function.arguments:
+                        fragments[1] += tool_call.function.arguments
+            
+            if buffer.strip():
+                yield AgentResponse(agent_name="scrum_master_advisor", success=True, data=buffer)
+            
+            if pending_calls:
+                logger.info(f"🔧 Scrum Master AI selected {len(pending_calls)} action(s)")
+                calls = [(name, args) for _, (name, args) in sorted(pending_calls.items())]
+                async for response in self._iter_scrum_actions(calls):
+                    yield response
+        
+        except Exception as e:
+            logger.error(f"❌ Scrum Master AI error: {str(e)}")
+            yield AgentResponse(
+                agent_name="scrum_master_error", 
+                success=False, 
+                data=None, 
+                error_message=str(e)
+            )
+
+    async def _run_scrum_actions(self, calls: List[Tuple[str, Any]]) -> List[AgentResponse]:
+        """Run (name, raw arguments) tool calls, concurrently unless disabled."""
+        if self.enable_parallel_tool_execution:
+            # Actions are independent Jira/Confluence round trips; overlap them
+            return list(await asyncio.gather(*(self._run_scrum_action(name, args) for name, args in calls)))
+        return [await self._run_scrum_action(name, args) for name, args in calls]
+
+    async def _iter_scrum_actions(self, calls: List[Tuple[str, Any]]) -> AsyncIterator[AgentResponse]:
+        """Like _run_scrum_actions, but yield each result in completion order."""
+        if not self.enable_parallel_tool_execution:
+            for name, args in calls:
+                yield await self._run_scrum_action(name, args)
+            return
+        tasks = [asyncio.ensure_future(self._run_scrum_action(name, args)) for name, args in calls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer may stop early (e.g. client disconnected). Reads are
+            # cancelled; writes run to completion, since a half-finished one could
+            # leave a partial sprint or issues behind
+            for (name, _), task in zip(calls, tasks):
+                if task.done():
+                    continue
+                if name in _SPRINT_WRITE_ACTIONS:
+                    self._detached_writes.add(task)
+                    task.add_done_callback(self._detached_writes.discard)
+                else:
+                    task.cancel()
+
+    async def _run_scrum_action(self, name: str, args: Any) -> AgentResponse:
+        """Execute a single LLM tool call and wrap the outcome in an AgentResponse."""
+        try:
+            # Streamed calls to argument-less tools can arrive with an empty string
+            parsed_args = orjson.loads(args) if args and isinstance(args, (str, bytes)) else (args or {})
+            logger.info(f"🛠️ Executing Scrum Master action: {name}")
+            
+            data = await self._invoke_scrum_action(name, parsed_args)
+            
+            if isinstance(data, dict) and data.get("error"):
+                return AgentResponse(
+                    agent_name=f"scrum_master_{name}", 
+                    success=False, 
+                    data=data, 
+                    error_message=data.get("error")
+                )
+            logger.info(f"✅ Scrum Master action completed: {name}")
+            return AgentResponse(
+                agent_name=f"scrum_master_{name}", 
+                success=True, 
+                data=data
+            )
+        except Exception as e:
+            logger.error(f"❌ Scrum Master action failed: {name} - {str(e)}")
+            return AgentResponse(
+                agent_name=f"scrum_master_{name}", 
+                success=False, 
+                data=None, 
+                error_message=str(e)
+            )
+
     async def _invoke_scrum_action(self, action_name: str, args: Dict[str, Any]) -> Any:
         """Invoke Scrum Master actions."""
         try:
-            if action_name == "start_sprint":
-                return await self.scrum_master.start_sprint(**args)
-            elif action_name == "plan_sprint":
-                return await self.scrum_master.plan_sprint(**args)
-            elif action_name == "conduct_standup":
-                return await self.scrum_master.conduct_standup(**args)
-            elif action_name == "assign_tasks":
-                return await self.scrum_master.assign_tasks(**args)
-            elif action_name == "generate_burndown":
-                return await self.scrum_master.generate_burndown(**args)
+            if action_name in _SPRINT_WRITE_ACTIONS:
+                try:
+                    return await self._action_dispatch[action_name](**args)
+                finally:
+                    # Sprint state may have changed; cached reads are stale
+                    self._action_cache.clear()
+            elif action_name in _CACHEABLE_ACTION_TTLS:
+                return await self._cached_read(action_name, args)
             elif action_name == "sprint_report":
-                # Create a comprehensive sprint report
-                standup_data = await self.scrum_master.conduct_standup(**args)
-                burndown_data = await self.scrum_master.generate_burndown(**args)
+                # Create a comprehensive sprint report from the (cached) standup
+                # and burndown reads, which take only the project key
+                read_args = {"jira_project_key": args["jira_project_key"]}
+                standup_data, burndown_data = await asyncio.gather(
+                    self._cached_read("conduct_standup", read_args),
+                    self._cached_read("generate_burndown", read_args),
+                )
                 
                 return {
                     "sprint_status": standup_data,
@@ -324,6 +475,20 @@ class ScrumMasterCoordinator:
             logger.error(f"❌ Scrum Master action execution error: {str(e)}")
             return {"error": str(e)}
 
+    async def _cached_read(self, action_name: str, args: Dict[str, Any]) -> Any:
+        """Run a read-only action, reusing a result younger than its TTL.
+
+        Concurrent reads of the same action and args (e.g. conduct_standup
+        and sprint_report in one turn) share a single fetch.
+        """
+        return await self._action_cache.get_or_fetch(
+            TTLCache.make_key({"action": action_name, "args": args}),
+            lambda: self._action_dispatch[action_name](**args),
+            # Errors such as "No active sprint" must not outlive a start_sprint
+            cacheable=lambda data: not (isinstance(data, dict) and data.get("error")),
+            ttl_for=lambda data: _action_ttl(action_name, data),
+        )
+
     def _generate_recommendations(self, standup_data: Dict[str, Any], burndown_data: Dict[str, Any]) -> List[str]:
         """Generate Scrum Master recommendations based on sprint data."""
         recommendations = []
@@ -333,21 +498,48 @@ class ScrumMasterCoordinator:
             if blocked_count > 0:
                 recommendations.append(f"🚫 Address {blocked_count} blocked issues immediately")
             
-            progress = standup_data.get("sprint_progress", "0%")
-            if progress.replace("%", "").replace(".", "").isdigit():
-                progress_num = float(progress.replace("%", ""))
-                if progress_num < 50:
-                    recommendations.append("⚠️ Sprint progress is below 50% - consider scope adjustment")
+            progress_num = _parse_percentage(standup_data.get("sprint_progress", "0%"))
+            if progress_num is not None and progress_num < 50:
+                recommendations.append("⚠️ Sprint progress is below 50% - consider scope adjustment")
         
         if isinstance(burndown_data, dict):
-            completion = burndown_data.get("completion_percentage", 0)
-            if completion > 80:
+            completion = _parse_percentage(burndown_data.get("completion_percentage", 0))
+            if completion is not None and completion > 80:
                 recommendations.append("🎉 Sprint is on track for successful completion")
-            elif completion < 30:
+            elif completion is not None and completion < 30:
                 recommendations.append("📈 Consider adding team capacity or reducing scope")
         
         return recommendations
 
 
+def _action_ttl(action_name: str, data: Any) -> float:
+    """TTL for a cached read, longer once its result rarely moves.
+
+    sprint_report is built from these two reads, so it is effectively
+    cached for the shorter of their TTLs.
+    """
+    if isinstance(data, dict):
+        if action_name == "conduct_standup" and data.get("days_remaining", 0) < 0:
+            return _SETTLED_SPRINT_TTL
+        if action_name == "generate_burndown" and (
+            data.get("days_remaining") == 0
+            # A sprint with no committed points has nothing to burn down yet
+            or (data.get("total_story_points", 0) > 0 and data.get("remaining_points", 1) <= 0)
+        ):
+            return _SETTLED_SPRINT_TTL
+    return _CACHEABLE_ACTION_TTLS[action_name]
+
+
+def _parse_percentage(value: Any) -> Optional[float]:
+    """Return value as a number if it is numeric or a percentage string, else None."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        match = _PCT_RE.match(value)
+        if match:
+            return float(match.group(1))
+    return None
+
+
 # Global coordinator instance for ADK web interface
 scrum_master_coordinator = ScrumMasterCoordinator()
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Optional
 
+from ..models import DATACLASS_SLOTS
+
 
 class CommandType(Enum):
     JIRA_ISSUE = "jira_issue"
@@ -17,7 +19,7 @@ class CommandType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Command:
     command_id: str
     command_type: CommandType
@@ -27,8 +29,14 @@ class Command:
     timestamp: Optional[float] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentResponse:
+    """Internal result of an agent/tool call.
+
+    Deliberately a plain dataclass rather than a validated model: it never
+    crosses the API boundary, so construction should stay validation-free.
+    """
+
     agent_name: str
     success: bool
     data: Any
@@ -3,21 +3,54 @@
 Features:
 - Remote HTTPS URLs supported out of the box
 - Env-driven auth headers (Bearer tokens, API keys)
-- Configurable timeouts and simple retry logic
+- Configurable timeouts and retries with jittered exponential backoff
+- Per-client cap on concurrent requests (<SERVICE>_MCP_MAX_CONCURRENCY)
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict, Optional
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
 
 import aiohttp
+import orjson
 from aiohttp import ClientTimeout
 import ssl
 
 logger = logging.getLogger(__name__)
 
+# Pooled sessions shared by MCPClients talking to the same server with the
+# same credentials, so keep-alive connections and DNS cache are reused. Keys
+# end with the event loop the session was created on (see _acquire_session)
+_SESSION_REGISTRY: Dict[Tuple[Any, ...], aiohttp.ClientSession] = {}
+_SESSION_REFCOUNTS: Dict[Tuple[Any, ...], int] = {}
+
+_REQUEST_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+_BODY_METHODS = frozenset({"POST", "PUT"})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+@dataclass(frozen=True)
+class ServiceProfile:
+    """Per-service settings, looked up once by service name."""
+
+    health_endpoint: str
+
+
+_DEFAULT_PROFILE = ServiceProfile(health_endpoint="/health")
+_SERVICE_PROFILES: Dict[str, ServiceProfile] = {
+    "jira": ServiceProfile(health_endpoint="/serverInfo"),
+    "confluence": ServiceProfile(health_endpoint="/space"),
+}
+
 
 class MCPClient:
     """Async HTTP client for MCP servers (health + basic requests)."""
@@ -30,14 +63,24 @@ class MCPClient:
         timeout_seconds: int = 30,
         max_retries: int = 2,
         verify_ssl: bool = True,
+        max_concurrent_requests: Optional[int] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.service = service
+        self._profile = _SERVICE_PROFILES.get(service.lower(), _DEFAULT_PROFILE)
         self.session: Optional[aiohttp.ClientSession] = None
         self.connected = False
         self.timeout = ClientTimeout(total=timeout_seconds)
         self.max_retries = max_retries
         self.verify_ssl = verify_ssl
+        # Cap on in-flight requests from this client, so bursts of parallel
+        # tool calls queue here instead of tripping the server's rate limits
+        self.max_concurrent_requests = max_concurrent_requests or int(
+            os.getenv(f"{service.upper()}_MCP_MAX_CONCURRENCY", "16")
+        )
+        # Created on first use (see _request_slots): on Python 3.9 a semaphore binds
+        # to the event loop current at construction, and clients are built at import time
+        self._semaphore: Optional[asyncio.Semaphore] = None
         
         # Create SSL context
         if not verify_ssl:
@@ -62,24 +105,25 @@ class MCPClient:
             env_headers["x-api-key"] = api_key
 
         self.headers: Dict[str, str] = {**env_headers, **(headers or {})}
+        # Clients with the same key share one pooled session (see _acquire_session);
+        # timeouts stay per client and are passed with every request
+        self._session_key: Tuple[str, str, bool, Tuple[Tuple[str, str], ...]] = (
+            self.base_url,
+            self.service,
+            verify_ssl,
+            tuple(sorted(self.headers.items())),
+        )
+        # _session_key plus the event loop, set while this client holds a session
+        self._registry_key: Optional[Tuple[Any, ...]] = None
 
     async def connect(self) -> bool:
         try:
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context) if not self.verify_ssl else None
-            self.session = aiohttp.ClientSession(
-                timeout=self.timeout, 
-                headers=self.headers or None,
-                connector=connector
-            )
-            # Use different health check endpoints for different services
-            if "jira" in self.service.lower():
-                health_endpoint = "/serverInfo"
-            elif "confluence" in self.service.lower():
-                health_endpoint = "/space"
-            else:
-                health_endpoint = "/health"
-                
-            async with self.session.get(f"{self.base_url}{health_endpoint}") as resp:
+            if self.session is None or self._registry_key[-1] is not asyncio.get_running_loop():
+                # First connect, or reconnecting from a new event loop: the old
+                # session and semaphore belong to the previous loop
+                self.session = self._acquire_session()
+                self._semaphore = None
+            async with self.session.get(f"{self.base_url}{self._profile.health_endpoint}", timeout=self.timeout) as resp:
                 self.connected = resp.status == 200
                 if not self.connected:
                     logger.error("%s MCP health check failed: %s", self.service, resp.status)
@@ -90,10 +134,51 @@ class MCPClient:
 
     async def disconnect(self) -> None:
         if self.session:
-            await self.session.close()
+            await self._release_session()
         self.session = None
         self.connected = False
 
+    def _acquire_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session for this server, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        # Sessions are bound to their loop; forget those left behind by a loop
+        # that has since closed (e.g. an earlier asyncio.run without disconnect)
+        for stale in [key for key in _SESSION_REGISTRY if key[-1].is_closed()]:
+            del _SESSION_REGISTRY[stale]
+            del _SESSION_REFCOUNTS[stale]
+        key = self._registry_key = (*self._session_key, loop)
+        session = _SESSION_REGISTRY.get(key)
+        if session is None or session.closed:
+            connector_kwargs: Dict[str, Any] = {"ssl": self.ssl_context} if self.ssl_context else {}
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                **connector_kwargs,
+            )
+            session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                headers=self.headers or None,
+                connector=connector,
+            )
+            _SESSION_REGISTRY[key] = session
+            _SESSION_REFCOUNTS[key] = 0
+        _SESSION_REFCOUNTS[key] += 1
+        return session
+
+    async def _release_session(self) -> None:
+        """Drop this client's reference; the last client closes the session."""
+        key = self._registry_key
+        remaining = _SESSION_REFCOUNTS.get(key, 1) - 1
+        if remaining > 0 and _SESSION_REGISTRY.get(key) is self.session:
+            _SESSION_REFCOUNTS[key] = remaining
+            return
+        if _SESSION_REGISTRY.get(key) is self.session:
+            del _SESSION_REGISTRY[key]
+            del _SESSION_REFCOUNTS[key]
+        await self.session.close()
+
     async def request(
         self,
         endpoint: str,
@@ -109,23 +194,21 @@ class MCPClient:
             url = f"{url}?{urlencode(params)}"
 
         method_upper = method.upper()
+        if method_upper not in _REQUEST_METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        send = getattr(self.session, method_upper.lower())
+        body: Dict[str, Any] = {}
+        if method_upper in _BODY_METHODS and json is not None:
+            # Encoded once up front and reused by every retry attempt
+            body = {"data": orjson.dumps(json), "headers": _JSON_CONTENT_TYPE}
+
         for attempt in range(self.max_retries + 1):
             try:
-                if method_upper == "GET":
-                    async with self.session.get(url) as resp:
-                        return await self._parse_response(url, resp)
-                if method_upper == "POST":
-                    async with self.session.post(url, json=json) as resp:
-                        return await self._parse_response(url, resp)
-                if method_upper == "PUT":
-                    async with self.session.put(url, json=json) as resp:
-                        return await self._parse_response(url, resp)
-                if method_upper == "DELETE":
-                    async with self.session.delete(url) as resp:
-                        return await self._parse_response(url, resp)
-                raise ValueError(f"Unsupported method: {method}")
+                # The slot is released before any backoff sleep
+                async with self._request_slots(), send(url, timeout=self.timeout, **body) as resp:
+                    return await self._parse_response(url, resp)
             except Exception as exc:  # noqa: BLE001
-                is_last = attempt >= self.max_retries
+                delay = self._retry_delay(exc, method_upper, attempt)
                 logger.warning(
                     "MCP request error (%s %s) attempt %d/%d: %s",
                     method_upper,
@@ -134,8 +217,51 @@ class MCPClient:
                     self.max_retries + 1,
                     exc,
                 )
-                if is_last:
+                if delay is None or attempt >= self.max_retries:
                     raise
+                await asyncio.sleep(delay)
+
+    def _request_slots(self) -> asyncio.Semaphore:
+        """Return the in-flight request cap, creating it inside the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        return self._semaphore
+
+    @staticmethod
+    def _retry_delay(exc: Exception, method: str, attempt: int) -> Optional[float]:
+        """Backoff before retrying after exc, or None if the request must not be retried.
+
+        Rejected (429) and never-sent requests are safe to repeat for any method;
+        server errors and dropped connections only for idempotent methods, since a
+        POST may already have created the issue or page.
+        """
+        if isinstance(exc, aiohttp.ClientResponseError):
+            if exc.status == 429:
+                retryable = True
+            else:
+                retryable = exc.status in _RETRYABLE_STATUSES and method in _IDEMPOTENT_METHODS
+        elif isinstance(exc, aiohttp.ClientConnectorError):
+            retryable = True
+        elif isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+            retryable = method in _IDEMPOTENT_METHODS
+        else:
+            retryable = False
+        if not retryable:
+            return None
+
+        delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.8, 1.2)
+        retry_after = exc.headers.get("Retry-After") if isinstance(exc, aiohttp.ClientResponseError) and exc.headers else None
+        if retry_after:
+            try:
+                requested = float(retry_after)
+            except ValueError:
+                pass  # HTTP-date form; keep the computed backoff
+            else:
+                # Waiting longer would park the request (and the API call behind it)
+                if requested > _RETRY_MAX_DELAY:
+                    return None
+                delay = max(delay, requested)
+        return delay
 
     async def _parse_response(self, url: str, resp: aiohttp.ClientResponse) -> Dict[str, Any]:  # type: ignore[name-defined]
         """Parse response with error handling, returning JSON dict.
@@ -147,7 +273,7 @@ class MCPClient:
         content_type = resp.headers.get("Content-Type", "")
         if status >= 400:
             try:
-                data = await resp.json()
+                data = await resp.json(loads=orjson.loads)
             except Exception:
                 text = await resp.text()
                 data = {"error": text}
@@ -160,7 +286,9 @@ class MCPClient:
                 headers=resp.headers,
             )
         if "application/json" in content_type:
-            return await resp.json()
+            # Decode the raw bytes directly; skips aiohttp's bytes -> str step
+            body = await resp.read()
+            return orjson.loads(body) if body.strip() else None
         # fallback to text
         text = await resp.text()
         return {"text": text}
@@ -0,0 +1,9 @@
+"""Data models shared by the agents, coordinators and API."""
+from __future__ import annotations
+
+import sys
+from typing import Dict
+
+# Slotted dataclasses drop the per-instance __dict__; dataclass(slots=True)
+# needs Python 3.10+, so older interpreters get regular dataclasses
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
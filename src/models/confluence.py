@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
+from . import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ConfluencePage:
     id: str
     title: str
@@ -23,7 +25,7 @@ class ConfluencePage:
     children: List[str]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ConfluenceSpace:
     key: str
     name: str
@@ -37,7 +39,7 @@ class ConfluenceSpace:
     total_pages: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ConfluenceAttachment:
     id: str
     filename: str
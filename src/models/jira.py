@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
+from . import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class JiraIssue:
     key: str
     summary: str
@@ -25,7 +27,7 @@ class JiraIssue:
     sprint: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class JiraProject:
     key: str
     name: str
@@ -38,7 +40,7 @@ class JiraProject:
     issue_types: List[str]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class JiraSprint:
     id: int
     name: str
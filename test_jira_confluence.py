@@ -3,122 +3,100 @@
 
 import asyncio
 import aiohttp
-import os
-from dotenv import load_dotenv
+import sys
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 
-# Load environment variables
-load_dotenv()
+from probe_common import (
+    CONFLUENCE_BASE_URL,
+    CONFLUENCE_TOKEN,
+    JIRA_BASE_URL,
+    JIRA_TOKEN,
+    Handler,
+    list_report,
+    probe,
+    probe_session,
+)
 
-async def test_jira_endpoints():
-    """Test various Jira endpoints to find available projects."""
-    base_url = "https://athonprompt.atlassian.net/rest/api/3"
-    auth_token = os.getenv("IRA_MCP_AUTH_TOKEN")  # Note: it's IRA, not JIRA
-    
-    if not auth_token:
-        print("❌ IRA_MCP_AUTH_TOKEN not found in environment")
-        return
-    
-    headers = {"Authorization": auth_token}
-    
-    # Test different endpoints
-    endpoints = [
-        "/project",
-        "/project/search",
-        "/project/category",
-        "/serverInfo",
-        "/myself",
-        "/field",
-        "/issuetype"
-    ]
-    
-    # Create SSL context to disable verification
-    import ssl
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
-    
-    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-        print("🔍 Testing Jira endpoints...")
-        for endpoint in endpoints:
-            try:
-                url = f"{base_url}{endpoint}"
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        print(f"✅ {endpoint}: {resp.status}")
-                        if endpoint == "/project":
-                            if isinstance(data, list):
-                                print(f"   📋 Found {len(data)} projects:")
-                                for project in data[:5]:  # Show first 5
-                                    print(f"      - {project.get('key', 'N/A')}: {project.get('name', 'N/A')}")
-                            else:
-                                print(f"   📋 Response: {type(data)} - {str(data)[:200]}")
-                        elif endpoint == "/serverInfo":
-                            print(f"   🖥️  Server: {data.get('serverTitle', 'N/A')}")
-                    else:
-                        print(f"❌ {endpoint}: {resp.status}")
-            except Exception as e:
-                print(f"❌ {endpoint}: Error - {str(e)}")
+# (endpoint, full URL) pairs, built once at import. Paged endpoints probed
+# only for their status ask for a single item to keep the payload small.
+JIRA_PROBES: Tuple[Tuple[str, str], ...] = tuple(
+    (endpoint, f"{JIRA_BASE_URL}{endpoint}{query}")
+    for endpoint, query in (
+        ("/project", ""),
+        ("/project/search", "?maxResults=1"),
+        ("/project/category", ""),
+        ("/serverInfo", ""),
+        ("/myself", ""),
+        ("/field", ""),
+        ("/issuetype", ""),
+    )
+)
+CONFLUENCE_PROBES: Tuple[Tuple[str, str], ...] = tuple(
+    (endpoint, f"{CONFLUENCE_BASE_URL}{endpoint}{query}")
+    for endpoint, query in (
+        ("/space", ""),
+        ("/space/search", "?limit=1"),
+        ("/content", "?limit=1"),
+        ("/user/current", ""),
+        ("/settings/lookandfeel", ""),
+    )
+)
 
-async def test_confluence_endpoints():
-    """Test various Confluence endpoints to find available spaces."""
-    base_url = "https://athonprompt.atlassian.net/wiki/rest/api"
-    auth_token = os.getenv("CONFLUENCE_MCP_AUTH_TOKEN")
-    
-    if not auth_token:
-        print("❌ CONFLUENCE_MCP_AUTH_TOKEN not found in environment")
-        return
-    
-    headers = {"Authorization": auth_token}
-    
-    # Test different endpoints
-    endpoints = [
-        "/space",
-        "/space/search",
-        "/content",
-        "/user/current",
-        "/settings/lookandfeel"
-    ]
-    
-    # Create SSL context to disable verification
-    import ssl
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
-    
-    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-        print("\n🔍 Testing Confluence endpoints...")
-        for endpoint in endpoints:
-            try:
-                url = f"{base_url}{endpoint}"
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        print(f"✅ {endpoint}: {resp.status}")
-                        if endpoint == "/space":
-                            if "results" in data:
-                                spaces = data["results"]
-                                print(f"   📋 Found {len(spaces)} spaces:")
-                                for space in spaces[:5]:  # Show first 5
-                                    print(f"      - {space.get('key', 'N/A')}: {space.get('name', 'N/A')}")
-                            else:
-                                print(f"   📋 Response: {type(data)} - {str(data)[:200]}")
-                    else:
-                        print(f"❌ {endpoint}: {resp.status}")
-            except Exception as e:
-                print(f"❌ {endpoint}: Error - {str(e)}")
+def report_server_info(data: Any) -> List[str]:
+    return [f"   🖥️  Server: {data.get('serverTitle', 'N/A')}"]
+
+# Endpoints whose data is reported; only these responses are decoded
+JIRA_HANDLERS: Dict[str, Handler] = {
+    "/project": list_report("projects", lambda data: data, 5),  # Show first 5
+    "/serverInfo": report_server_info,
+}
+CONFLUENCE_HANDLERS: Dict[str, Handler] = {
+    "/space": list_report("spaces", lambda data: data["results"], 5),  # Show first 5
+}
+
+async def probe_jira_endpoints(session: aiohttp.ClientSession) -> List[str]:
+    """Test various Jira endpoints to find available projects.
+
+    Returns the report lines so main() can print them in a stable order.
+    """
+    if not JIRA_TOKEN:
+        return ["❌ IRA_MCP_AUTH_TOKEN not found in environment"]
+    reports = await probe(session, JIRA_TOKEN, JIRA_PROBES, JIRA_HANDLERS)
+    return ["🔍 Testing Jira endpoints...", *chain.from_iterable(reports)]
+
+async def probe_confluence_endpoints(session: aiohttp.ClientSession) -> List[str]:
+    """Test various Confluence endpoints to find available spaces.
+
+    Returns the report lines so main() can print them in a stable order.
+    """
+    if not CONFLUENCE_TOKEN:
+        return ["❌ CONFLUENCE_MCP_AUTH_TOKEN not found in environment"]
+    reports = await probe(session, CONFLUENCE_TOKEN, CONFLUENCE_PROBES, CONFLUENCE_HANDLERS)
+    return ["\n🔍 Testing Confluence endpoints...", *chain.from_iterable(reports)]
 
-async def main():
-    """Main test function."""
+async def main(session: Optional[aiohttp.ClientSession] = None):
+    """Main test function; pass session to reuse an open one."""
     print("🚀 Testing Jira and Confluence API endpoints...")
     print("=" * 60)
     
-    await test_jira_endpoints()
-    await test_confluence_endpoints()
+    if not (JIRA_TOKEN or CONFLUENCE_TOKEN):
+        # Nothing can be probed; don't bother setting up a session
+        print("❌ IRA_MCP_AUTH_TOKEN and CONFLUENCE_MCP_AUTH_TOKEN not found in environment")
+    else:
+        async with probe_session(session) as session:
+            # The probes are independent and network-bound; run them side by side
+            results = await asyncio.gather(
+                probe_jira_endpoints(session), probe_confluence_endpoints(session), return_exceptions=True
+            )
+        report: List[str] = []
+        for name, result in zip(("Jira", "Confluence"), results):
+            if isinstance(result, BaseException):
+                report.append(f"❌ {name} probe failed: {result}")
+            else:
+                report.extend(result)
+        # One write for the whole report instead of a print() per line
+        sys.stdout.write("\n".join(report) + "\n")
     
     print("\n" + "=" * 60)
     print("✅ Testing complete!")
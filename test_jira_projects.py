@@ -3,116 +3,97 @@
 
 import asyncio
 import aiohttp
-import os
-from dotenv import load_dotenv
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-# Load environment variables
-load_dotenv()
+from probe_common import JIRA_BASE_URL, JIRA_TOKEN, Handler, list_report, probe, probe_session
 
-async def test_jira_project_discovery():
+def report_issue_projects(data: Any) -> List[str]:
+    try:
+        issues = data["issues"]
+    except (KeyError, TypeError):
+        return [f"   📋 Response structure: {list(data.keys()) if isinstance(data, dict) else type(data)}"]
+    lines = [f"   📋 Found {len(issues)} issues"]
+    projects_seen = set()
+    for issue in issues:
+        project = issue.get("fields", {}).get("project", {})
+        project_key = project.get("key", "")
+        if project_key and project_key not in projects_seen:
+            projects_seen.add(project_key)
+            lines.append(f"      - Project from issue: {project_key}: {project.get('name', 'N/A')}")
+    return lines
+
+def report_myself(data: Any) -> List[str]:
+    return [
+        f"   👤 User: {data.get('displayName', 'N/A')} ({data.get('emailAddress', 'N/A')})",
+        f"   🔑 Account ID: {data.get('accountId', 'N/A')}",
+    ]
+
+# Discovery methods 1-4 as (heading, label, full URL), built once at import
+DISCOVERY_METHODS: Tuple[Tuple[str, str, str], ...] = (
+    ("1️⃣ Testing /project endpoint with parameters...", "/project?expand=...",
+     f"{JIRA_BASE_URL}/project?expand=lead,description,url,projectKeys"),
+    ("2️⃣ Testing /project/search endpoint...", "/project/search",
+     f"{JIRA_BASE_URL}/project/search?maxResults=50"),
+    ("3️⃣ Testing /search to find projects from issues...", "/search with JQL",
+     f"{JIRA_BASE_URL}/search?jql=project is not EMPTY&maxResults=10&fields=project"),
+    ("4️⃣ Testing /myself to check user permissions...", "/myself",
+     f"{JIRA_BASE_URL}/myself"),
+)
+DISCOVERY_HANDLERS: Dict[str, Handler] = {
+    "/project?expand=...": list_report("projects", lambda data: data, 3),
+    "/project/search": list_report("projects", lambda data: data["values"], 3),
+    "/search with JQL": report_issue_projects,
+    "/myself": report_myself,
+}
+
+# Fallback methods (2 and 3), only needed when /project lists nothing
+FALLBACK_LABELS = frozenset({"/project/search", "/search with JQL"})
+
+async def probe_jira_project_discovery(session: aiohttp.ClientSession):
     """Test different methods to find Jira projects."""
-    base_url = "https://athonprompt.atlassian.net/rest/api/3"
-    auth_token = os.getenv("IRA_MCP_AUTH_TOKEN")
-    
-    if not auth_token:
-        print("❌ IRA_MCP_AUTH_TOKEN not found in environment")
-        return
-    
-    headers = {"Authorization": auth_token}
-    
-    # Create SSL context to disable verification
-    import ssl
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
+    print("🔍 Testing different Jira project discovery methods...")
+    projects: List[Any] = []
+    report_projects = DISCOVERY_HANDLERS["/project?expand=..."]
+
+    def remember_projects(data: Any) -> List[str]:
+        if isinstance(data, list):
+            projects.extend(data)
+        return report_projects(data)
+
+    handlers = {**DISCOVERY_HANDLERS, "/project?expand=...": remember_projects}
+
+    async def run_methods(wanted: Callable[[str], bool]) -> Dict[str, List[str]]:
+        """Probe the selected methods at once; report lines by label."""
+        pairs = [(label, url) for _, label, url in DISCOVERY_METHODS if wanted(label)]
+        reports = await probe(session, JIRA_TOKEN, pairs, handlers, indent="   ")
+        return {label: lines for (label, _), lines in zip(pairs, reports)}
+
+    # Method 1 and the /myself diagnostic first; the fallbacks only if needed
+    reports = await run_methods(lambda label: label not in FALLBACK_LABELS)
+    if projects:
+        reports.update((label, ["   ⏭️  Skipped: /project already listed the projects"]) for label in FALLBACK_LABELS)
+    else:
+        reports.update(await run_methods(lambda label: label in FALLBACK_LABELS))
     
-    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-        print("🔍 Testing different Jira project discovery methods...")
-        
-        # Method 1: Try /project with different parameters
-        print("\n1️⃣ Testing /project endpoint with parameters...")
-        try:
-            url = f"{base_url}/project?expand=lead,description,url,projectKeys"
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    print(f"   ✅ /project?expand=lead,description,url,projectKeys: {len(data) if isinstance(data, list) else 'Not a list'}")
-                    if isinstance(data, list) and len(data) > 0:
-                        print(f"   📋 Found {len(data)} projects:")
-                        for project in data[:3]:
-                            print(f"      - {project.get('key', 'N/A')}: {project.get('name', 'N/A')}")
-                else:
-                    print(f"   ❌ /project?expand=...: {resp.status}")
-        except Exception as e:
-            print(f"   ❌ /project?expand=...: Error - {str(e)}")
-        
-        # Method 2: Try /project/search
-        print("\n2️⃣ Testing /project/search endpoint...")
-        try:
-            url = f"{base_url}/project/search?maxResults=50"
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    print(f"   ✅ /project/search: {resp.status}")
-                    if "values" in data:
-                        projects = data["values"]
-                        print(f"   📋 Found {len(projects)} projects:")
-                        for project in projects[:3]:
-                            print(f"      - {project.get('key', 'N/A')}: {project.get('name', 'N/A')}")
-                    else:
-                        print(f"   📋 Response structure: {list(data.keys()) if isinstance(data, dict) else type(data)}")
-                else:
-                    print(f"   ❌ /project/search: {resp.status}")
-        except Exception as e:
-            print(f"   ❌ /project/search: Error - {str(e)}")
-        
-        # Method 3: Try to get issues and extract project info
-        print("\n3️⃣ Testing /search to find projects from issues...")
-        try:
-            url = f"{base_url}/search?jql=project is not EMPTY&maxResults=10&fields=project"
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    print(f"   ✅ /search with JQL: {resp.status}")
-                    if "issues" in data:
-                        issues = data["issues"]
-                        print(f"   📋 Found {len(issues)} issues")
-                        projects_seen = set()
-                        for issue in issues:
-                            project = issue.get("fields", {}).get("project", {})
-                            project_key = project.get("key", "")
-                            if project_key and project_key not in projects_seen:
-                                projects_seen.add(project_key)
-                                print(f"      - Project from issue: {project_key}: {project.get('name', 'N/A')}")
-                    else:
-                        print(f"   📋 Response structure: {list(data.keys()) if isinstance(data, dict) else type(data)}")
-                else:
-                    print(f"   ❌ /search with JQL: {resp.status}")
-        except Exception as e:
-            print(f"   ❌ /search with JQL: Error - {str(e)}")
-        
-        # Method 4: Try /myself to check user permissions
-        print("\n4️⃣ Testing /myself to check user permissions...")
-        try:
-            url = f"{base_url}/myself"
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    print(f"   ✅ /myself: {resp.status}")
-                    print(f"   👤 User: {data.get('displayName', 'N/A')} ({data.get('emailAddress', 'N/A')})")
-                    print(f"   🔑 Account ID: {data.get('accountId', 'N/A')}")
-                else:
-                    print(f"   ❌ /myself: {resp.status}")
-        except Exception as e:
-            print(f"   ❌ /myself: Error - {str(e)}")
+    report: List[str] = []
+    for heading, label, _ in DISCOVERY_METHODS:
+        report.append(f"\n{heading}")
+        report.extend(reports[label])
+    # One write for the whole report instead of a print() per line
+    sys.stdout.write("\n".join(report) + "\n")
 
-async def main():
-    """Main test function."""
+async def main(session: Optional[aiohttp.ClientSession] = None):
+    """Main test function; pass session to reuse an open one."""
     print("🚀 Testing Jira project discovery methods...")
     print("=" * 70)
     
-    await test_jira_project_discovery()
+    if not JIRA_TOKEN:
+        # Checked before any session is set up
+        print("❌ IRA_MCP_AUTH_TOKEN not found in environment")
+    else:
+        async with probe_session(session) as session:
+            await probe_jira_project_discovery(session)
     
     print("\n" + "=" * 70)
     print("✅ Testing complete!")
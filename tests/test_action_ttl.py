@@ -0,0 +1,48 @@
+"""Tests for the Scrum Master's cached-read TTLs."""
+import pytest
+
+from src.core.scrum_master_coordinator import _CACHEABLE_ACTION_TTLS, _SETTLED_SPRINT_TTL, _action_ttl
+
+
+def _burndown(total, completed, days_remaining):
+    # Shape returned by ScrumMasterAgent.generate_burndown
+    return {
+        "total_story_points": total,
+        "completed_points": completed,
+        "remaining_points": total - completed,
+        "ideal_remaining": 0,
+        "days_elapsed": 14 - days_remaining,
+        "days_remaining": days_remaining,
+        "completion_percentage": (completed / total * 100) if total > 0 else 0,
+    }
+
+
+def _standup(days_remaining):
+    return {"sprint_name": "Sprint 1", "blocked_issues": [], "total_issues": 3, "days_remaining": days_remaining}
+
+
+@pytest.mark.parametrize("action", sorted(_CACHEABLE_ACTION_TTLS))
+def test_error_results_use_the_action_default(action):
+    assert _action_ttl(action, {"error": "No active sprint"}) == _CACHEABLE_ACTION_TTLS[action]
+
+
+def test_running_standup_uses_the_short_ttl():
+    assert _action_ttl("conduct_standup", _standup(3)) == _CACHEABLE_ACTION_TTLS["conduct_standup"]
+    assert _action_ttl("conduct_standup", _standup(0)) == _CACHEABLE_ACTION_TTLS["conduct_standup"]
+
+
+def test_standup_after_sprint_end_is_settled():
+    assert _action_ttl("conduct_standup", _standup(-1)) == _SETTLED_SPRINT_TTL
+
+
+def test_running_burndown_uses_the_short_ttl():
+    assert _action_ttl("generate_burndown", _burndown(20, 8, 5)) == _CACHEABLE_ACTION_TTLS["generate_burndown"]
+
+
+def test_running_sprint_without_points_uses_the_short_ttl():
+    assert _action_ttl("generate_burndown", _burndown(0, 0, 5)) == _CACHEABLE_ACTION_TTLS["generate_burndown"]
+
+
+@pytest.mark.parametrize("burndown", [_burndown(20, 20, 5), _burndown(20, 23, 5), _burndown(20, 8, 0)])
+def test_burned_down_or_ended_sprint_is_settled(burndown):
+    assert _action_ttl("generate_burndown", burndown) == _SETTLED_SPRINT_TTL
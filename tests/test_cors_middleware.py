@@ -0,0 +1,110 @@
+"""Tests for the pure ASGI CORS middleware."""
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.api.middleware import PureCORSMiddleware
+
+
+async def _ok_app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _call(middleware: PureCORSMiddleware, method: str, headers: Dict[str, str]) -> Tuple[int, Dict[bytes, List[bytes]]]:
+    """Run one request through the middleware; return the status and response headers."""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": "/",
+        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()],
+    }
+    messages: List[Dict[str, Any]] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    start = messages[0]
+    response_headers: Dict[bytes, List[bytes]] = {}
+    for name, value in start["headers"]:
+        response_headers.setdefault(name, []).append(value)
+    return start["status"], response_headers
+
+
+def _header(headers: Dict[bytes, List[bytes]], name: bytes) -> Optional[bytes]:
+    values = headers.get(name)
+    return values[0] if values else None
+
+
+def _preflight(method: str = "POST", request_headers: Optional[str] = None, origin: str = "https://app.example") -> Dict[str, str]:
+    headers = {"Origin": origin, "Access-Control-Request-Method": method}
+    if request_headers is not None:
+        headers["Access-Control-Request-Headers"] = request_headers
+    return headers
+
+
+def test_preflight_allowed_returns_200_with_methods():
+    middleware = PureCORSMiddleware(_ok_app, allow_methods=["GET", "POST"], allow_headers=["X-Token"])
+    status, headers = _call(middleware, "OPTIONS", _preflight("POST", "x-token, Content-Type"))
+    assert status == 200
+    assert _header(headers, b"access-control-allow-origin") == b"*"
+    assert _header(headers, b"access-control-allow-methods") == b"GET, POST"
+    assert _header(headers, b"access-control-allow-headers") == b"X-Token"
+
+
+def test_preflight_disallowed_method_returns_400():
+    middleware = PureCORSMiddleware(_ok_app, allow_methods=["GET"])
+    status, _ = _call(middleware, "OPTIONS", _preflight("DELETE"))
+    assert status == 400
+
+
+def test_preflight_disallowed_header_returns_400():
+    middleware = PureCORSMiddleware(_ok_app, allow_headers=["X-Token"])
+    status, _ = _call(middleware, "OPTIONS", _preflight("GET", "X-Other"))
+    assert status == 400
+
+
+def test_preflight_disallowed_origin_returns_400_without_origin_header():
+    middleware = PureCORSMiddleware(_ok_app, allow_origins=["https://app.example"])
+    status, headers = _call(middleware, "OPTIONS", _preflight(origin="https://evil.example"))
+    assert status == 400
+    assert _header(headers, b"access-control-allow-origin") is None
+
+
+def test_preflight_wildcard_headers_echoes_requested():
+    middleware = PureCORSMiddleware(_ok_app)
+    status, headers = _call(middleware, "OPTIONS", _preflight("PUT", "X-Anything"))
+    assert status == 200
+    assert _header(headers, b"access-control-allow-headers") == b"X-Anything"
+
+
+def test_credentialed_wildcard_echoes_origin_and_varies():
+    middleware = PureCORSMiddleware(_ok_app, allow_credentials=True)
+    status, headers = _call(middleware, "GET", {"Origin": "https://app.example"})
+    assert status == 200
+    assert _header(headers, b"access-control-allow-origin") == b"https://app.example"
+    assert _header(headers, b"access-control-allow-credentials") == b"true"
+    assert _header(headers, b"vary") == b"Origin"
+
+
+def test_uncredentialed_wildcard_uses_star_without_vary():
+    middleware = PureCORSMiddleware(_ok_app)
+    _, headers = _call(middleware, "GET", {"Origin": "https://app.example"})
+    assert _header(headers, b"access-control-allow-origin") == b"*"
+    assert _header(headers, b"vary") is None
+
+
+def test_disallowed_origin_passes_through_without_cors_headers():
+    middleware = PureCORSMiddleware(_ok_app, allow_origins=["https://app.example"])
+    status, headers = _call(middleware, "GET", {"Origin": "https://evil.example"})
+    assert status == 200
+    assert _header(headers, b"access-control-allow-origin") is None
+
+
+def test_request_without_origin_is_untouched():
+    middleware = PureCORSMiddleware(_ok_app)
+    _, headers = _call(middleware, "GET", {})
+    assert _header(headers, b"access-control-allow-origin") is None
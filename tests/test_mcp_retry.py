@@ -0,0 +1,73 @@
+"""Tests for MCPClient's retry policy."""
+import asyncio
+
+import aiohttp
+import pytest
+
+from src.integrations.mcp_client import MCPClient
+
+
+def _response_error(status, headers=None):
+    return aiohttp.ClientResponseError(request_info=None, history=(), status=status, headers=headers)
+
+
+def _connector_error():
+    return aiohttp.ClientConnectorError(connection_key=None, os_error=OSError(111, "Connection refused"))
+
+
+@pytest.mark.parametrize("method", ["GET", "POST", "PUT", "DELETE"])
+def test_rate_limited_requests_retry_for_any_method(method):
+    assert MCPClient._retry_delay(_response_error(429), method, 0) is not None
+
+
+@pytest.mark.parametrize("status", [500, 502, 503, 504])
+def test_server_errors_retry_only_idempotent_methods(status):
+    assert MCPClient._retry_delay(_response_error(status), "GET", 0) is not None
+    assert MCPClient._retry_delay(_response_error(status), "PUT", 0) is not None
+    assert MCPClient._retry_delay(_response_error(status), "POST", 0) is None
+
+
+@pytest.mark.parametrize("status", [400, 401, 404, 409])
+def test_client_errors_never_retry(status):
+    assert MCPClient._retry_delay(_response_error(status), "GET", 0) is None
+
+
+def test_connector_errors_retry_even_for_post():
+    # The request never reached the server, so repeating it cannot duplicate a write
+    assert MCPClient._retry_delay(_connector_error(), "POST", 0) is not None
+
+
+@pytest.mark.parametrize("exc", [aiohttp.ServerDisconnectedError(), asyncio.TimeoutError()])
+def test_dropped_connections_retry_only_idempotent_methods(exc):
+    assert MCPClient._retry_delay(exc, "GET", 0) is not None
+    assert MCPClient._retry_delay(exc, "POST", 0) is None
+
+
+def test_unrelated_errors_never_retry():
+    assert MCPClient._retry_delay(ValueError("bad payload"), "GET", 0) is None
+
+
+@pytest.mark.parametrize("attempt, base", [(0, 0.5), (1, 1.0), (3, 4.0), (10, 30.0)])
+def test_backoff_is_exponential_jittered_and_capped(attempt, base):
+    delay = MCPClient._retry_delay(_response_error(503), "GET", attempt)
+    assert base * 0.8 <= delay <= base * 1.2
+
+
+def test_retry_after_seconds_raise_the_delay():
+    delay = MCPClient._retry_delay(_response_error(429, {"Retry-After": "7"}), "POST", 0)
+    assert delay == 7.0
+
+
+def test_retry_after_beyond_the_cap_gives_up():
+    assert MCPClient._retry_delay(_response_error(429, {"Retry-After": "3600"}), "GET", 0) is None
+
+
+def test_retry_after_below_backoff_keeps_backoff():
+    delay = MCPClient._retry_delay(_response_error(429, {"Retry-After": "0"}), "GET", 3)
+    assert delay >= 4.0 * 0.8
+
+
+def test_retry_after_http_date_keeps_backoff():
+    headers = {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}
+    delay = MCPClient._retry_delay(_response_error(429, headers), "GET", 0)
+    assert 0.4 <= delay <= 0.6
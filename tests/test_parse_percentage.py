@@ -0,0 +1,24 @@
+"""Tests for the Scrum Master's percentage parsing."""
+import pytest
+
+from src.core.scrum_master_coordinator import _parse_percentage
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (42, 42.0),
+        (42.5, 42.5),
+        ("42", 42.0),
+        ("42.5%", 42.5),
+        (" 42 % ", 42.0),
+        ("0%", 0.0),
+    ],
+)
+def test_accepts_numbers_and_percent_strings(value, expected):
+    assert _parse_percentage(value) == expected
+
+
+@pytest.mark.parametrize("value", [True, False, None, "", "%", "abc", "-5%", "1e2", "4 2", "42%%", [42]])
+def test_rejects_everything_else(value):
+    assert _parse_percentage(value) is None
@@ -0,0 +1,192 @@
+"""Tests for the TTL cache and the LLM response cache built on it."""
+import asyncio
+from types import SimpleNamespace
+
+from src.core.cache import TTLCache
+from src.core.llm_agent import LiteLlm, LLMResponseCache, _is_cacheable, temperature_from_env
+
+
+def _counting_fetch(calls, value="value", delay=0.01):
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return value
+
+    return fetch
+
+
+def test_concurrent_fetches_are_coalesced():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    calls = []
+    fetch = _counting_fetch(calls)
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["value"] * 5
+    assert len(calls) == 1
+    assert cache._inflight == {}
+
+
+def test_late_callers_join_the_inflight_fetch():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    calls = []
+    fetch = _counting_fetch(calls, delay=0.05)
+
+    async def late():
+        await asyncio.sleep(0.01)
+        return await cache.get_or_fetch("k", fetch)
+
+    async def run():
+        return await asyncio.gather(cache.get_or_fetch("k", fetch), late(), late())
+
+    assert asyncio.run(run()) == ["value"] * 3
+    assert len(calls) == 1
+
+
+def test_uncacheable_values_release_waiters_to_fetch_concurrently():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    calls = []
+    fetch = _counting_fetch(calls, delay=0.05)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(*(cache.get_or_fetch("k", fetch, lambda value: False) for _ in range(5)))
+        return results, loop.time() - started
+
+    results, elapsed = asyncio.run(run())
+    assert results == ["value"] * 5
+    assert len(calls) == 5
+    # One leader fetch, then the four waiters side by side - not one after another
+    assert elapsed < 0.05 * 4
+    assert cache.get("k") is None
+
+
+def test_failed_fetch_lets_waiters_retry():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return "value"
+
+    async def run():
+        return await asyncio.gather(cache.get_or_fetch("k", flaky), cache.get_or_fetch("k", flaky), return_exceptions=True)
+
+    first, second = asyncio.run(run())
+    assert isinstance(first, RuntimeError)
+    assert second == "value"
+    assert cache._inflight == {}
+
+
+def test_ttl_for_picks_the_stored_ttl():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+
+    async def fetch():
+        return {"days_remaining": -1}
+
+    asyncio.run(cache.get_or_fetch("k", fetch, ttl_for=lambda value: -1.0))
+    assert cache.get("k") is None
+    asyncio.run(cache.get_or_fetch("k", fetch, ttl_for=lambda value: 300.0))
+    assert cache.get("k") == {"days_remaining": -1}
+
+def _reply(tool_calls=None):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="hi", tool_calls=tool_calls))])
+
+
+def test_get_returns_stored_value():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_expired_entries_are_dropped():
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    cache.set("a", 1, ttl=-1.0)
+    assert cache.get("a") is None
+    assert "a" not in cache._entries
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_make_key_ignores_dict_order():
+    assert TTLCache.make_key({"a": 1, "b": [2]}) == TTLCache.make_key({"b": [2], "a": 1})
+    assert TTLCache.make_key({"a": 1}) != TTLCache.make_key({"a": 2})
+
+
+def test_only_deterministic_models_get_a_response_cache():
+    assert LiteLlm(model="m").response_cache is None
+    assert LiteLlm(model="m", temperature=0.7).response_cache is None
+    assert isinstance(LiteLlm(model="m", temperature=0).response_cache, LLMResponseCache)
+
+
+def test_temperature_from_env(monkeypatch):
+    monkeypatch.delenv("LITELLM_TEMPERATURE", raising=False)
+    assert temperature_from_env() is None
+    assert temperature_from_env(0.0) == 0.0
+    monkeypatch.setenv("LITELLM_TEMPERATURE", "0.3")
+    assert temperature_from_env(0.0) == 0.3
+
+
+def test_forced_tool_choice_gets_no_cache_key():
+    messages = [{"role": "user", "content": "hi"}]
+    llm = LiteLlm(model="m", temperature=0)
+    assert llm._cache_key(messages, None, "auto", None) is not None
+    assert llm._cache_key(messages, None, "required", None) is None
+
+
+def test_replies_with_tool_calls_are_not_cacheable():
+    assert _is_cacheable(_reply())
+    assert not _is_cacheable(_reply(tool_calls=[SimpleNamespace(id="call_1")]))
+
+
+def _fake_completions(llm, reply):
+    calls = []
+
+    async def fake_acompletion(params):
+        calls.append(params)
+        return reply
+
+    llm._acompletion = fake_acompletion
+    return calls
+
+
+def test_tool_call_replies_reach_the_model_every_time():
+    llm = LiteLlm(model="m", temperature=0)
+    calls = _fake_completions(llm, _reply(tool_calls=[SimpleNamespace(id="call_1")]))
+    messages = [{"role": "user", "content": "create an issue"}]
+
+    async def run():
+        await llm.acomplete(messages)
+        await llm.acomplete(messages)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_plain_replies_are_served_from_cache():
+    llm = LiteLlm(model="m", temperature=0)
+    calls = _fake_completions(llm, _reply())
+    messages = [{"role": "user", "content": "hello"}]
+
+    async def run():
+        return await llm.acomplete(messages), await llm.acomplete(messages)
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert len(calls) == 1
+    assert calls[0]["temperature"] == 0
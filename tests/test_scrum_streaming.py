@@ -0,0 +1,120 @@
+"""Tests for ScrumMasterCoordinator's streaming paths."""
+import asyncio
+from types import SimpleNamespace
+
+from src.core.scrum_master_coordinator import ScrumMasterCoordinator
+
+
+def _slow_action(events, name, delay):
+    async def action(**kwargs):
+        events.append(f"{name} started")
+        await asyncio.sleep(delay)
+        events.append(f"{name} finished")
+        return {"action": name}
+
+    return action
+
+
+def test_early_stop_cancels_reads_but_finishes_writes():
+    coordinator = ScrumMasterCoordinator()
+    events = []
+    coordinator._action_dispatch = {
+        "generate_burndown": _slow_action(events, "generate_burndown", 0.01),
+        "conduct_standup": _slow_action(events, "conduct_standup", 0.2),
+        "start_sprint": _slow_action(events, "start_sprint", 0.05),
+    }
+    calls = [
+        ("generate_burndown", '{"jira_project_key": "PROJ"}'),
+        ("conduct_standup", '{"jira_project_key": "PROJ"}'),
+        ("start_sprint", '{"jira_project_key": "PROJ"}'),
+    ]
+
+    async def run():
+        stream = coordinator._iter_scrum_actions(calls)
+        first = await stream.__anext__()
+        await stream.aclose()  # the consumer goes away after one result
+        await asyncio.gather(*coordinator._detached_writes)
+        await asyncio.sleep(0)
+        return first
+
+    first = asyncio.run(run())
+    assert first.agent_name == "scrum_master_generate_burndown"
+    assert "start_sprint finished" in events
+    assert "conduct_standup finished" not in events
+    assert not coordinator._detached_writes
+
+
+def _chunk(content=None, tool_calls=None):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content, tool_calls=tool_calls))])
+
+
+def _tool_delta(index, name=None, arguments=None):
+    return SimpleNamespace(index=index, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+class _FakeStreamingAgent:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def achat_stream(self, user_message, tools=None):
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+
+def _collect(coordinator, message="hi"):
+    async def run():
+        return [response async for response in coordinator.chat_execute_stream(message)]
+
+    return asyncio.run(run())
+
+
+def test_advisory_text_is_flushed_at_sentence_boundaries():
+    coordinator = ScrumMasterCoordinator()
+    coordinator.llm_agent = _FakeStreamingAgent(
+        [_chunk("Hello the"), _chunk("re. How "), _chunk("are you? Fine"), _chunk(".")]
+    )
+    responses = _collect(coordinator)
+    assert [r.data for r in responses] == ["Hello there. ", "How are you? ", "Fine."]
+    assert all(r.agent_name == "scrum_master_advisor" and r.success for r in responses)
+
+
+def test_tool_call_deltas_are_assembled_before_dispatch():
+    coordinator = ScrumMasterCoordinator()
+    received = {}
+
+    def recording(name):
+        async def action(**kwargs):
+            received[name] = kwargs
+            return {"action": name}
+
+        return action
+
+    coordinator._action_dispatch = {name: recording(name) for name in ("conduct_standup", "generate_burndown")}
+    coordinator.llm_agent = _FakeStreamingAgent([
+        _chunk(tool_calls=[_tool_delta(0, "conduct_", '{"jira_pro')]),
+        _chunk(tool_calls=[_tool_delta(0, "standup", 'ject_key": "PROJ"}'), _tool_delta(1, "generate_burndown")]),
+        _chunk(tool_calls=[_tool_delta(1, arguments='{"jira_project_key": "DEV"}')]),
+    ])
+    responses = _collect(coordinator)
+    assert sorted(r.agent_name for r in responses) == ["scrum_master_conduct_standup", "scrum_master_generate_burndown"]
+    assert all(r.success for r in responses)
+    assert received == {
+        "conduct_standup": {"jira_project_key": "PROJ"},
+        "generate_burndown": {"jira_project_key": "DEV"},
+    }
+
+
+def test_stream_errors_become_an_error_response():
+    coordinator = ScrumMasterCoordinator()
+
+    class _Failing:
+        async def achat_stream(self, user_message, tools=None):
+            raise RuntimeError("provider down")
+            yield  # pragma: no cover - makes this an async generator
+
+    coordinator.llm_agent = _Failing()
+    responses = _collect(coordinator)
+    assert len(responses) == 1
+    assert responses[0].agent_name == "scrum_master_error"
+    assert responses[0].error_message == "provider down"